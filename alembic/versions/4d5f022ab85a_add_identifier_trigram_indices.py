@@ -0,0 +1,41 @@
+"""Add trigram indices for identifier substring search
+
+Revision ID: 4d5f022ab85a
+Revises: ec5d2787bec9
+Create Date: 2026-10-14 10:32:08.518227
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '4d5f022ab85a'
+down_revision = 'ec5d2787bec9'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_doi_identifiers_identifier_trgm',
+        'doi_identifiers',
+        ['identifier'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'identifier': 'gin_trgm_ops'},
+    )
+    op.create_index(
+        'ix_publication_identifiers_identifier_trgm',
+        'publication_identifiers',
+        ['identifier'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'identifier': 'gin_trgm_ops'},
+    )
+
+
+def downgrade():
+    op.drop_index('ix_publication_identifiers_identifier_trgm', table_name='publication_identifiers')
+    op.drop_index('ix_doi_identifiers_identifier_trgm', table_name='doi_identifiers')
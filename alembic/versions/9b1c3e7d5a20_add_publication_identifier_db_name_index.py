@@ -0,0 +1,29 @@
+"""Add composite index on publication identifier and database name
+
+Revision ID: 9b1c3e7d5a20
+Revises: 4d5f022ab85a
+Create Date: 2026-10-14 14:05:41.276930
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '9b1c3e7d5a20'
+down_revision = '4d5f022ab85a'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_publication_identifiers_identifier_db_name',
+        'publication_identifiers',
+        ['identifier', 'db_name'],
+        unique=False,
+    )
+
+
+def downgrade():
+    op.drop_index('ix_publication_identifiers_identifier_db_name', table_name='publication_identifiers')
@@ -0,0 +1,32 @@
+"""Add trigram index for publication DOI substring search
+
+Revision ID: c2e4a6f81b37
+Revises: 9b1c3e7d5a20
+Create Date: 2026-10-14 14:40:17.903512
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'c2e4a6f81b37'
+down_revision = '9b1c3e7d5a20'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    op.create_index(
+        'ix_publication_identifiers_doi_trgm',
+        'publication_identifiers',
+        ['doi'],
+        unique=False,
+        postgresql_using='gin',
+        postgresql_ops={'doi': 'gin_trgm_ops'},
+    )
+
+
+def downgrade():
+    op.drop_index('ix_publication_identifiers_doi_trgm', table_name='publication_identifiers')
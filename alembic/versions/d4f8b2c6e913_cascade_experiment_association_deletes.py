@@ -0,0 +1,37 @@
+"""Cascade deletes from experiments to their keyword and identifier associations
+
+Revision ID: d4f8b2c6e913
+Revises: c2e4a6f81b37
+Create Date: 2026-10-14 15:22:49.160385
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'd4f8b2c6e913'
+down_revision = 'c2e4a6f81b37'
+branch_labels = None
+depends_on = None
+
+association_tables = ["experiment_doi_identifiers", "experiment_keywords", "experiment_sra_identifiers"]
+
+
+def upgrade():
+    for table_name in association_tables:
+        op.drop_constraint(f"{table_name}_experiment_id_fkey", table_name, type_="foreignkey")
+        op.create_foreign_key(
+            f"{table_name}_experiment_id_fkey",
+            table_name,
+            "experiments",
+            ["experiment_id"],
+            ["id"],
+            ondelete="CASCADE",
+        )
+
+
+def downgrade():
+    for table_name in association_tables:
+        op.drop_constraint(f"{table_name}_experiment_id_fkey", table_name, type_="foreignkey")
+        op.create_foreign_key(f"{table_name}_experiment_id_fkey", table_name, "experiments", ["experiment_id"], ["id"])
@@ -0,0 +1,28 @@
+"""Default experiment and raw read identifier dates in the database
+
+Revision ID: e7a1c9d3f5b2
+Revises: d4f8b2c6e913
+Create Date: 2026-10-14 16:03:27.541872
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'e7a1c9d3f5b2'
+down_revision = 'd4f8b2c6e913'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    for table_name in ["experiments", "sra_identifiers"]:
+        op.alter_column(table_name, "creation_date", server_default=sa.text("CURRENT_DATE"))
+        op.alter_column(table_name, "modification_date", server_default=sa.text("CURRENT_DATE"))
+
+
+def downgrade():
+    for table_name in ["experiments", "sra_identifiers"]:
+        op.alter_column(table_name, "creation_date", server_default=None)
+        op.alter_column(table_name, "modification_date", server_default=None)
@@ -0,0 +1,31 @@
+"""Add partial index on published score sets
+
+Revision ID: f3b8d1a6c042
+Revises: e7a1c9d3f5b2
+Create Date: 2026-10-14 17:42:09.318604
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = 'f3b8d1a6c042'
+down_revision = 'e7a1c9d3f5b2'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(
+        'ix_scoresets_published',
+        'scoresets',
+        ['id'],
+        unique=False,
+        postgresql_include=['published_date'],
+        postgresql_where=sa.text('published_date IS NOT NULL'),
+    )
+
+
+def downgrade():
+    op.drop_index('ix_scoresets_published', table_name='scoresets')
@@ -10,12 +10,23 @@ DB_DATABASE_NAME = os.getenv("DB_DATABASE_NAME")
 DB_USERNAME = os.getenv("DB_USERNAME")
 DB_PASSWORD = os.getenv("DB_PASSWORD")
 
+# Connection pool settings. The pool size should cover the number of concurrent requests a worker serves; connections
+# beyond it are opened temporarily, up to the overflow limit.
+DB_POOL_SIZE = int(os.getenv("DB_POOL_SIZE") or 20)
+DB_MAX_OVERFLOW = int(os.getenv("DB_MAX_OVERFLOW") or 40)
+DB_POOL_RECYCLE = int(os.getenv("DB_POOL_RECYCLE") or 3600)
+
 # DB_URL = "sqlite:///./sql_app.db"
 DB_URL = f"postgresql://{DB_USERNAME}:{DB_PASSWORD}@{DB_HOST}:{DB_PORT}/{DB_DATABASE_NAME}"
 
 engine = create_engine(
     # For PostgreSQL:
-    DB_URL
+    DB_URL,
+    pool_size=DB_POOL_SIZE,
+    max_overflow=DB_MAX_OVERFLOW,
+    # Check connections on checkout, and replace them before they can be dropped by the server or a proxy.
+    pool_pre_ping=True,
+    pool_recycle=DB_POOL_RECYCLE,
     # For SQLite:
     # DB_URL, connect_args={"check_same_thread": False}
 )
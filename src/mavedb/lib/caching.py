@@ -0,0 +1,143 @@
+import hashlib
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Hashable, Optional, Union
+
+from fastapi import Request
+from fastapi.responses import ORJSONResponse, Response
+from sqlalchemy import event, inspect
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+# A mapped class, any change to which invalidates a cache, or a single mapped attribute whose changes do.
+CacheDependency = Union[type, InstrumentedAttribute]
+
+# Each cache cleared by writes, along with the mapped classes and attributes its entries are read from.
+_caches_invalidated_on_write: "weakref.WeakKeyDictionary[TTLCache, tuple[CacheDependency, ...]]" = (
+    weakref.WeakKeyDictionary()
+)
+
+# Key under which a session's info collects the (class, attribute key) pairs written by its uncommitted flushes. An
+# attribute key of None stands for the whole object, which was inserted or deleted.
+_WRITTEN_ATTRIBUTES_KEY = "mavedb.lib.caching.written_attributes"
+
+
+class TTLCache:
+    """
+    A small thread-safe, in-process cache whose entries expire a fixed number of seconds after they are set.
+
+    Once the cache holds `maxsize` entries, setting a new key evicts the least recently set one.
+    """
+
+    def __init__(self, ttl: float, maxsize: int = 128):
+        self.ttl = ttl
+        self.maxsize = maxsize
+        self._entries: OrderedDict[Hashable, tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+def invalidate_on_write(cache: TTLCache, *dependencies: CacheDependency) -> TTLCache:
+    """
+    Clear a cache whenever a session in this process commits a write to any of the given mapped classes or attributes,
+    or to anything at all if none are given.
+
+    Writes made by other processes are not seen, so the cache's TTL bounds how stale its entries can become.
+
+    :param cache: The cache to clear
+    :param dependencies: The mapped classes, or individual mapped attributes, that the cache's entries are read from
+    :return: The cache
+    """
+    _caches_invalidated_on_write[cache] = dependencies
+    return cache
+
+
+def _depends_on(dependencies: tuple[CacheDependency, ...], written: set[tuple[type, Optional[str]]]) -> bool:
+    if not dependencies:
+        return True
+    for dependency in dependencies:
+        if isinstance(dependency, InstrumentedAttribute):
+            if any(issubclass(cls, dependency.parent.class_) and key in (None, dependency.key) for cls, key in written):
+                return True
+        elif any(issubclass(cls, dependency) for cls, _ in written):
+            return True
+    return False
+
+
+def json_body_with_etag(content: Any) -> tuple[bytes, str]:
+    """
+    Serialize JSON-compatible content as a response body, along with a strong ETag derived from it.
+
+    :param content: The content to serialize
+    :return: The serialized body and its ETag
+    """
+    body = ORJSONResponse(content=content).body
+    return body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+
+def conditional_json_response(request: Request, body: bytes, etag: str) -> Response:
+    """
+    Respond with a JSON body, or with 304 Not Modified if the client already holds the representation with this ETag.
+
+    :param request: The incoming request, whose If-None-Match header is checked
+    :param body: A serialized JSON body
+    :param etag: The body's ETag
+    :return: The response to send
+    """
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        client_etags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+        if etag in client_etags or "*" in client_etags:
+            return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
+
+
+def clear_caches() -> None:
+    for cache in list(_caches_invalidated_on_write.keys()):
+        cache.clear()
+
+
+@event.listens_for(Session, "after_flush")
+def _collect_written_attributes(session: Session, flush_context: Any) -> None:
+    written: set[tuple[type, Optional[str]]] = session.info.setdefault(_WRITTEN_ATTRIBUTES_KEY, set())
+    for obj in (*session.new, *session.deleted):
+        written.add((type(obj), None))
+    for obj in session.dirty:
+        written.update((type(obj), attr.key) for attr in inspect(obj).attrs if attr.history.has_changes())
+
+
+@event.listens_for(Session, "after_commit")
+def _clear_caches_after_commit(session: Session) -> None:
+    written = session.info.pop(_WRITTEN_ATTRIBUTES_KEY, None)
+    if not written:
+        return
+    for cache, dependencies in list(_caches_invalidated_on_write.items()):
+        if _depends_on(dependencies, written):
+            cache.clear()
+
+
+@event.listens_for(Session, "after_rollback")
+def _discard_written_attributes(session: Session) -> None:
+    session.info.pop(_WRITTEN_ATTRIBUTES_KEY, None)
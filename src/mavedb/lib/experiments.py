@@ -2,9 +2,10 @@ import logging
 from typing import Optional
 
 from sqlalchemy import func, or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, joinedload, raiseload, selectinload
 
 from mavedb.models.experiment import Experiment
+from mavedb.models.experiment_publication_identifier import ExperimentPublicationIdentifierAssociation
 from mavedb.models.score_set import ScoreSet
 from mavedb.models.user import User
 from mavedb.view_models.search import ExperimentsSearch
@@ -12,9 +13,23 @@ from mavedb.models.publication_identifier import PublicationIdentifier
 
 logger = logging.getLogger(__name__)
 
+# Load every relationship read while serializing an experiment up front, rather than lazily once per experiment.
+experiment_loader_options = (
+    joinedload(Experiment.experiment_set),
+    joinedload(Experiment.created_by),
+    joinedload(Experiment.modified_by),
+    selectinload(Experiment.keyword_objs),
+    selectinload(Experiment.doi_identifiers),
+    selectinload(Experiment.raw_read_identifiers),
+    selectinload(Experiment.publication_identifier_associations).joinedload(
+        ExperimentPublicationIdentifierAssociation.publication
+    ),
+    selectinload(Experiment.score_sets).selectinload(ScoreSet.superseding_score_set),
+)
+
 
 def search_experiments(db: Session, owner: Optional[User], search: ExperimentsSearch) -> list[Experiment]:
-    query = db.query(Experiment)
+    query = db.query(Experiment).options(*experiment_loader_options, raiseload("*"))
     # .filter(ScoreSet.private.is_(False))
 
     if owner is not None:
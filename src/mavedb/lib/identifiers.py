@@ -1,6 +1,6 @@
 import os
 from datetime import date
-from typing import Optional, Union, Mapping
+from typing import Callable, Mapping, Optional, TypeVar, Union
 
 import eutils  # type: ignore
 from idutils import is_doi, normalize_doi
@@ -12,6 +12,7 @@ from sqlalchemy.orm import Session
 
 from mavedb.lib.exceptions import AmbiguousIdentifierError, NonexistentIdentifierError
 from mavedb.lib.external_publications import Rxiv, Crossref, CrossrefWork, RxivContentDetail, PublicationAuthors
+from mavedb.lib.session_cache import session_cache
 from mavedb.lib.validation.publication import identifier_valid_for, validate_db_name
 from mavedb.models.doi_identifier import DoiIdentifier
 from mavedb.models.ensembl_identifier import EnsemblIdentifier
@@ -24,6 +25,8 @@ from mavedb.models.target_gene import TargetGene
 from mavedb.models.uniprot_identifier import UniprotIdentifier
 from mavedb.models.uniprot_offset import UniprotOffset
 
+IdentifierT = TypeVar("IdentifierT", DoiIdentifier, RawReadIdentifier)
+
 # XXX these classes all have an "identifier" attribute but there's no superclass
 # to unify them ...
 
@@ -184,6 +187,25 @@ async def find_or_create_doi_identifier(db: Session, identifier: str):
     return doi_identifier
 
 
+async def find_or_create_doi_identifiers(db: Session, identifiers: list[str]) -> list[DoiIdentifier]:
+    """
+    Find or create DOI identifier records for several identifier strings at once.
+
+    Existing records are loaded with a single query rather than one query per identifier. Repeated identifier strings
+    are only returned once.
+
+    :param db: An active database session
+    :param identifiers: A list of valid DOI identifiers
+    :return: A list of existing or new, unsaved DoiIdentifiers, in the same order as the identifier strings
+    """
+    return _find_or_create_identifiers(
+        db,
+        DoiIdentifier,
+        identifiers,
+        lambda identifier: DoiIdentifier(identifier=identifier, db_name="DOI", url=f"https://doi.org/{identifier}"),
+    )
+
+
 async def fetch_pubmed_article(identifier: str) -> Optional[PubmedArticle]:
     """
     Fetch an existing PubMed article from NCBI
@@ -361,6 +383,10 @@ async def find_or_create_publication_identifier(
     :param identifier: A valid publication identifier
     :return: An existing PublicationIdentifier containing the specified identifier string, or a new, unsaved PublicationIdentifier
     """
+    cache = session_cache(db, "publication_identifiers")
+    if (identifier, db_name) in cache:
+        return cache[(identifier, db_name)]
+
     article_matches = await find_generic_article(db, identifier, db_name)
 
     if not any(article_matches.values()):
@@ -377,12 +403,14 @@ async def find_or_create_publication_identifier(
 
     # If the article already exists, return it directly.
     if isinstance(matched_article, PublicationIdentifier):
-        return matched_article
-
-    # TODO(#214): It may be useful for internal consistency to use the Crossref record fetched via DOI if it exists. If a publication did not
-    #             have a DOI, we would need to use the record as returned by PubMed/bioRxiv/medRxiv.
+        publication_identifier = matched_article
+    else:
+        # TODO(#214): It may be useful for internal consistency to use the Crossref record fetched via DOI if it exists. If a publication did not
+        #             have a DOI, we would need to use the record as returned by PubMed/bioRxiv/medRxiv.
+        publication_identifier = create_generic_article(matched_article)
 
-    return create_generic_article(matched_article)
+    cache[(identifier, db_name)] = publication_identifier
+    return publication_identifier
 
 
 async def find_or_create_raw_read_identifier(db: Session, identifier: str):
@@ -394,6 +422,34 @@ async def find_or_create_raw_read_identifier(db: Session, identifier: str):
     return raw_read_identifier
 
 
+async def find_or_create_raw_read_identifiers(db: Session, identifiers: list[str]) -> list[RawReadIdentifier]:
+    return _find_or_create_identifiers(
+        db,
+        RawReadIdentifier,
+        identifiers,
+        lambda identifier: RawReadIdentifier(
+            identifier=identifier, db_name="SRA", url=f"http://www.ebi.ac.uk/ena/data/view/{identifier}"
+        ),
+    )
+
+
+def _find_or_create_identifiers(
+    db: Session,
+    identifier_class: type[IdentifierT],
+    identifiers: list[str],
+    create: Callable[[str], IdentifierT],
+) -> list[IdentifierT]:
+    found: dict[Optional[str], IdentifierT] = {}
+    if identifiers:
+        found = {
+            item.identifier: item
+            for item in db.scalars(
+                select(identifier_class).where(identifier_class.identifier.in_(set(identifiers)))  # type: ignore
+            )
+        }
+    return [found.get(identifier) or create(identifier) for identifier in dict.fromkeys(identifiers)]
+
+
 async def find_or_create_external_gene_identifier(db: Session, db_name: str, identifier: str):
     """
     Find an existing gene identifier record with the specified gene database name and identifier string, or create a new
@@ -409,6 +465,10 @@ async def find_or_create_external_gene_identifier(db: Session, db_name: str, ide
     identifier_class = EXTERNAL_GENE_IDENTIFIER_CLASSES[db_name]
     assert hasattr(identifier_class, "identifier")
 
+    cache = session_cache(db, "external_gene_identifiers")
+    if (db_name, identifier) in cache:
+        return cache[(db_name, identifier)]
+
     external_gene_identifier = (
         db.query(identifier_class).filter(identifier_class.identifier == identifier).one_or_none()
     )
@@ -420,6 +480,7 @@ async def find_or_create_external_gene_identifier(db: Session, db_name: str, ide
             # TODO Set URL from identifier
             # url=f'https://doi.org/{identifier}'
         )
+    cache[(db_name, identifier)] = external_gene_identifier
     return external_gene_identifier
 
 
@@ -0,0 +1,25 @@
+from typing import Optional
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from mavedb.models.keyword import Keyword
+
+
+def find_or_create_keywords(db: Session, keywords: list[str]) -> list[Keyword]:
+    """
+    Find existing keyword records with the specified texts, creating any that don't exist yet.
+
+    All existing keywords are looked up in a single query. Repeated texts are only returned once.
+
+    :param db: An active database session
+    :param keywords: A list of keyword texts
+    :return: A list of existing or new, unsaved Keywords, in the same order as the keyword texts
+    """
+    existing_keywords: dict[Optional[str], Keyword] = {}
+    if keywords:
+        existing_keywords = {
+            keyword_obj.text: keyword_obj
+            for keyword_obj in db.scalars(select(Keyword).where(Keyword.text.in_(set(keywords))))
+        }
+    return [existing_keywords.get(text) or Keyword(text=text) for text in dict.fromkeys(keywords)]
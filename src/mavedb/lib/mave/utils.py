@@ -6,6 +6,8 @@ NULL_VALUES = ("", "na", "nan", "nil", "none", "null", "n/a", "undefined", NA_VA
 
 
 NULL_VALUES_RE = re.compile("|".join(NULL_VALUES), flags=re.IGNORECASE)
+# Lowercased null values, for checking single values without running NULL_VALUES_RE.
+NULL_VALUES_SET = frozenset(v.lower() for v in NULL_VALUES)
 # NULL_VALUES_RE = re.compile(fr'|none|nan|na|undefined|n/a|null|nil|{NA_VALUE}', flags=re.IGNORECASE)
 
 
@@ -25,4 +27,4 @@ def is_csv_null(value):
     # Number 0 is treated as False so that all 0 will be converted to NA value.
     if value == 0:
         return value
-    return not value or NULL_VALUES_RE.fullmatch(str(value).strip().lower())
+    return not value or str(value).strip().lower() in NULL_VALUES_SET
@@ -1,15 +1,16 @@
 import csv
 import io
-import re
-from typing import Any, BinaryIO, Iterable, Optional, Sequence
+from typing import BinaryIO, Iterator, Optional, Sequence, Union
 
 import numpy as np
 import pandas as pd
 from pandas.testing import assert_index_equal
-from sqlalchemy import cast, func, Integer, or_, select
-from sqlalchemy.orm import aliased, contains_eager, joinedload, selectinload, Session
+from sqlalchemy import cast, func, insert, Integer, or_, select
+from sqlalchemy.engine import Row
+from sqlalchemy.orm import aliased, contains_eager, joinedload, raiseload, selectinload, Session
 
 from mavedb.lib.exceptions import ValidationError
+from mavedb.lib.experiments import experiment_loader_options
 from mavedb.lib.mave.constants import (
     HGVS_NT_COLUMN,
     HGVS_PRO_COLUMN,
@@ -23,7 +24,6 @@ from mavedb.models.doi_identifier import DoiIdentifier
 from mavedb.models.ensembl_offset import EnsemblOffset
 from mavedb.models.ensembl_identifier import EnsemblIdentifier
 from mavedb.models.experiment import Experiment
-from mavedb.models.experiment_publication_identifier import ExperimentPublicationIdentifierAssociation
 from mavedb.models.experiment_set import ExperimentSet
 from mavedb.models.keyword import Keyword
 from mavedb.models.publication_identifier import PublicationIdentifier
@@ -54,6 +54,34 @@ class HGVSColumns:
         return [cls.NUCLEOTIDE, cls.TRANSCRIPT, cls.PROTEIN]
 
 
+# Relationships read while serializing a score set's target genes.
+target_gene_loader_options = (
+    joinedload(TargetGene.ensembl_offset).joinedload(EnsemblOffset.identifier),
+    joinedload(TargetGene.refseq_offset).joinedload(RefseqOffset.identifier),
+    joinedload(TargetGene.uniprot_offset).joinedload(UniprotOffset.identifier),
+    joinedload(TargetGene.target_sequence).joinedload(TargetSequence.taxonomy),
+    joinedload(TargetGene.target_accession),
+)
+
+# Relationships read while serializing a score set with the full ScoreSet view model.
+score_set_loader_options = (
+    joinedload(ScoreSet.experiment).options(*experiment_loader_options),
+    joinedload(ScoreSet.license),
+    joinedload(ScoreSet.created_by),
+    joinedload(ScoreSet.modified_by),
+    joinedload(ScoreSet.superseded_score_set),
+    joinedload(ScoreSet.superseding_score_set),
+    selectinload(ScoreSet.meta_analyzes_score_sets),
+    selectinload(ScoreSet.meta_analyzed_by_score_sets),
+    selectinload(ScoreSet.keyword_objs),
+    selectinload(ScoreSet.doi_identifiers),
+    selectinload(ScoreSet.publication_identifier_associations).joinedload(
+        ScoreSetPublicationIdentifierAssociation.publication
+    ),
+    selectinload(ScoreSet.target_genes).options(*target_gene_loader_options),
+)
+
+
 def search_score_sets(db: Session, owner: Optional[User], search: ScoreSetsSearch) -> list[ScoreSet]:
     query = db.query(ScoreSet)  # \
     # .filter(ScoreSet.private.is_(False))
@@ -182,48 +210,18 @@ def search_score_sets(db: Session, owner: Optional[User], search: ScoreSetsSearc
             )
         )
 
+    # Load exactly what ShortScoreSet serializes. Collections are loaded in separate batched queries, since joining them
+    # all into the main query would return the product of their sizes for every score set.
     score_sets: list[ScoreSet] = (
         query.join(ScoreSet.experiment)
         .options(
-            contains_eager(ScoreSet.experiment).options(
-                joinedload(Experiment.experiment_set),
-                joinedload(Experiment.keyword_objs),
-                joinedload(Experiment.created_by),
-                joinedload(Experiment.modified_by),
-                joinedload(Experiment.keyword_objs),
-                joinedload(Experiment.doi_identifiers),
-                joinedload(Experiment.publication_identifier_associations).joinedload(
-                    ExperimentPublicationIdentifierAssociation.publication
-                ),
-                joinedload(Experiment.raw_read_identifiers),
-                selectinload(Experiment.score_sets).options(
-                    joinedload(ScoreSet.keyword_objs),
-                    joinedload(ScoreSet.doi_identifiers),
-                    joinedload(ScoreSet.publication_identifier_associations).joinedload(
-                        ScoreSetPublicationIdentifierAssociation.publication
-                    ),
-                    joinedload(ScoreSet.target_genes).options(
-                        joinedload(TargetGene.ensembl_offset).joinedload(EnsemblOffset.identifier),
-                        joinedload(TargetGene.refseq_offset).joinedload(RefseqOffset.identifier),
-                        joinedload(TargetGene.uniprot_offset).joinedload(UniprotOffset.identifier),
-                        joinedload(TargetGene.target_sequence).joinedload(TargetSequence.taxonomy),
-                        joinedload(TargetGene.target_accession),
-                    ),
-                ),
-            ),
-            joinedload(ScoreSet.keyword_objs),
+            contains_eager(ScoreSet.experiment).options(*experiment_loader_options),
             joinedload(ScoreSet.license),
-            joinedload(ScoreSet.doi_identifiers),
-            joinedload(ScoreSet.publication_identifier_associations).joinedload(
+            selectinload(ScoreSet.publication_identifier_associations).joinedload(
                 ScoreSetPublicationIdentifierAssociation.publication
             ),
-            joinedload(ScoreSet.target_genes).options(
-                joinedload(TargetGene.ensembl_offset).joinedload(EnsemblOffset.identifier),
-                joinedload(TargetGene.refseq_offset).joinedload(RefseqOffset.identifier),
-                joinedload(TargetGene.uniprot_offset).joinedload(UniprotOffset.identifier),
-                joinedload(TargetGene.target_sequence).joinedload(TargetSequence.taxonomy),
-                joinedload(TargetGene.target_accession),
-            ),
+            selectinload(ScoreSet.target_genes).options(*target_gene_loader_options),
+            raiseload("*"),
         )
         .order_by(Experiment.title)
         .all()
@@ -277,117 +275,90 @@ def find_meta_analyses_for_experiment_sets(db: Session, urns: list[str]) -> list
     )
 
 
-def get_score_set_counts_as_csv(
+def stream_score_set_counts_as_csv(
     db: Session, score_set: ScoreSet, start: Optional[int] = None, limit: Optional[int] = None
-) -> str:
+) -> Iterator[str]:
+    """Generate the count data of a score set's variants as CSV text, a batch of variants at a time."""
     assert type(score_set.dataset_columns) is dict
     count_columns = [str(x) for x in list(score_set.dataset_columns.get("count_columns", []))]
     columns = ["accession", "hgvs_nt", "hgvs_splice", "hgvs_pro"] + count_columns
-    type_column = "count_data"
+    return _stream_variants_as_csv(db, score_set, columns, "count_data", start, limit)
 
-    variants_query = (
-        select(Variant)
-        .where(Variant.score_set_id == score_set.id)
-        .order_by(cast(func.split_part(Variant.urn, "#", 2), Integer))
-    )
-    if start:
-        variants_query = variants_query.offset(start)
-    if limit:
-        variants_query = variants_query.limit(limit)
-    variants = db.scalars(variants_query).all()
 
-    rows_data = variants_to_csv_rows(variants, columns=columns, dtype=type_column)
-    stream = io.StringIO()
-    writer = csv.DictWriter(stream, fieldnames=columns, quoting=csv.QUOTE_MINIMAL)
-    writer.writeheader()
-    writer.writerows(rows_data)
-    return stream.getvalue()
-
-
-def get_score_set_scores_as_csv(
+def stream_score_set_scores_as_csv(
     db: Session, score_set: ScoreSet, start: Optional[int] = None, limit: Optional[int] = None
-) -> str:
+) -> Iterator[str]:
+    """Generate the score data of a score set's variants as CSV text, a batch of variants at a time."""
     assert type(score_set.dataset_columns) is dict
     score_columns = [str(x) for x in list(score_set.dataset_columns.get("score_columns", []))]
     columns = ["accession", "hgvs_nt", "hgvs_splice", "hgvs_pro"] + score_columns
-    type_column = "score_data"
+    return _stream_variants_as_csv(db, score_set, columns, "score_data", start, limit)
+
+
+def get_score_set_counts_as_csv(
+    db: Session, score_set: ScoreSet, start: Optional[int] = None, limit: Optional[int] = None
+) -> str:
+    return "".join(stream_score_set_counts_as_csv(db, score_set, start, limit))
+
 
+def get_score_set_scores_as_csv(
+    db: Session, score_set: ScoreSet, start: Optional[int] = None, limit: Optional[int] = None
+) -> str:
+    return "".join(stream_score_set_scores_as_csv(db, score_set, start, limit))
+
+
+def _stream_variants_as_csv(
+    db: Session,
+    score_set: ScoreSet,
+    columns: list[str],
+    dtype: str,
+    start: Optional[int] = None,
+    limit: Optional[int] = None,
+    batch_size: int = 1000,
+) -> Iterator[str]:
+    # Only the columns needed for the CSV are selected, and rows are fetched through a server-side cursor so that
+    # memory use stays bounded by the batch size rather than the size of the score set.
     variants_query = (
-        select(Variant)
+        select(Variant.urn, Variant.hgvs_nt, Variant.hgvs_pro, Variant.hgvs_splice, Variant.data)
         .where(Variant.score_set_id == score_set.id)
         .order_by(cast(func.split_part(Variant.urn, "#", 2), Integer))
+        .execution_options(yield_per=batch_size)
     )
     if start:
         variants_query = variants_query.offset(start)
     if limit:
         variants_query = variants_query.limit(limit)
-    variants = db.scalars(variants_query).all()
-
-    rows_data = variants_to_csv_rows(variants, columns=columns, dtype=type_column)
-    stream = io.StringIO()
-    writer = csv.DictWriter(stream, fieldnames=columns, quoting=csv.QUOTE_MINIMAL)
-    writer.writeheader()
-    writer.writerows(rows_data)
-    return stream.getvalue()
 
+    header = io.StringIO()
+    csv.writer(header, quoting=csv.QUOTE_MINIMAL, lineterminator="\r\n").writerow(columns)
+    yield header.getvalue()
 
-null_values_re = re.compile(r"\s+|none|nan|na|undefined|n/a|null|nil", flags=re.IGNORECASE)
+    for variants in db.execute(variants_query).partitions():
+        df = variants_to_csv_df(variants, columns=columns, dtype=dtype)
+        # pandas 1.4 names this argument line_terminator, while the pinned pandas-stubs only know its later name,
+        # lineterminator.
+        yield df.to_csv(
+            index=False, header=False, quoting=csv.QUOTE_MINIMAL, line_terminator="\r\n"  # type: ignore[call-overload]
+        )
 
 
-def is_null(value):
-    """Return True if a string represents a null value."""
-    value = str(value).strip().lower()
-    return null_values_re.fullmatch(value) or not value
+# Values written out as NA in CSV downloads. They are stripped and lowercased before comparison, so whitespace-only
+# values are covered by the empty string.
+null_values = frozenset({"", "none", "nan", "na", "undefined", "n/a", "null", "nil"})
 
 
-def variant_to_csv_row(variant: Variant, columns: list[str], dtype: str, na_rep="NA") -> dict[str, Any]:
+def variants_to_csv_df(
+    variants: Sequence[Union[Variant, Row]], columns: list[str], dtype: str, na_rep="NA"
+) -> pd.DataFrame:
     """
-    Format a variant into a containing the keys specified in `columns`.
+    Format variants into a data frame of strings with the columns specified in `columns`.
 
-    Parameters
-    ----------
-    variant : variant.models.Variant
-        List of variants.
-    columns : list[str]
-        Columns to serialize.
-    dtype : str, {'scores', 'counts'}
-        The type of data requested. Either the 'score_data' or 'count_data'.
-    na_rep : str
-        String to represent null values.
-
-    Returns
-    -------
-    dict[str, Any]
-    """
-    row = {}
-    for column_key in columns:
-        if column_key == "hgvs_nt":
-            value = str(variant.hgvs_nt)
-        elif column_key == "hgvs_pro":
-            value = str(variant.hgvs_pro)
-        elif column_key == "hgvs_splice":
-            value = str(variant.hgvs_splice)
-        elif column_key == "accession":
-            value = str(variant.urn)
-        else:
-            parent = variant.data.get(dtype) if variant.data else None
-            value = str(parent.get(column_key)) if parent else na_rep
-        if is_null(value):
-            value = na_rep
-        row[column_key] = value
-    return row
-
-
-def variants_to_csv_rows(
-    variants: Sequence[Variant], columns: list[str], dtype: str, na_rep="NA"
-) -> Iterable[dict[str, Any]]:
-    """
-    Format each variant into a dictionary row containing the keys specified in `columns`.
+    Values are converted to strings column by column, and any that represent null values are replaced by `na_rep`.
 
     Parameters
     ----------
     variants : list[variant.models.Variant]
-        List of variants.
+        List of variants, or rows with the same ``urn``, ``hgvs_*`` and ``data`` attributes.
     columns : list[str]
         Columns to serialize.
     dtype : str, {'scores', 'counts'}
@@ -397,9 +368,23 @@ def variants_to_csv_rows(
 
     Returns
     -------
-    list[dict[str, Any]]
+    pd.DataFrame
     """
-    return map(lambda v: variant_to_csv_row(v, columns, dtype, na_rep), variants)
+    records = (
+        {
+            **((variant.data.get(dtype) if variant.data else None) or {}),
+            "accession": variant.urn,
+            "hgvs_nt": variant.hgvs_nt,
+            "hgvs_splice": variant.hgvs_splice,
+            "hgvs_pro": variant.hgvs_pro,
+        }
+        for variant in variants
+    )
+    # Keep the original values until they are converted to strings, so that integers in a column with missing values
+    # are not first coerced to floats.
+    df = pd.DataFrame(records, columns=columns, dtype=object).astype(str)
+    null_mask = df.apply(lambda column: column.str.strip().str.lower().isin(null_values))
+    return df.mask(null_mask, na_rep)
 
 
 def find_meta_analyses_for_score_sets(db: Session, urns: list[str]) -> list[ScoreSet]:
@@ -572,42 +557,39 @@ def create_variants_data(scores, counts=None, index_col=None) -> list[VariantDat
 def create_variants(db, score_set: ScoreSet, variants_data: list[VariantData], batch_size=None) -> int:
     num_variants = len(variants_data)
     variant_urns = bulk_create_urns(num_variants, score_set, True)
-    variants = (
-        # TODO: Is there a nicer way to handle this than passing dicts into kwargs
-        # of the class initializer?
-        Variant(urn=urn, score_set_id=score_set.id, **kwargs)  # type: ignore
-        for urn, kwargs in zip(variant_urns, variants_data)
-    )
-    db.bulk_save_objects(variants)
-    db.add(score_set)
-    return len(score_set.variants)
+    if num_variants:
+        # Insert plain rows rather than Variant instances so that no ORM objects need to be built or tracked.
+        db.execute(
+            insert(Variant),
+            [{"urn": urn, "score_set_id": score_set.id, **kwargs} for urn, kwargs in zip(variant_urns, variants_data)],
+        )
+    return num_variants
 
 
 def bulk_create_urns(n, score_set, reset_counter=False) -> list[str]:
     start_value = 0 if reset_counter else score_set.num_variants
-    parent_urn = score_set.urn
-    child_urns = ["{}#{}".format(parent_urn, start_value + (i + 1)) for i in range(n)]
+    prefix = f"{score_set.urn}#"
+    child_urns = [f"{prefix}{i}" for i in range(start_value + 1, start_value + n + 1)]
     current_value = start_value + n
     score_set.num_variants = current_value
     return child_urns
 
 
-def csv_data_to_df(file_data: BinaryIO) -> pd.DataFrame:
-    extra_na_values = list(
-        set(
-            list(null_values_list)
-            + [str(x).lower() for x in null_values_list]
-            + [str(x).upper() for x in null_values_list]
-            + [str(x).capitalize() for x in null_values_list]
-        )
+# read_csv matches na_values case-sensitively, so include the common capitalizations of each null value.
+EXTRA_NA_VALUES = tuple(
+    sorted(
+        {variant for value in null_values_list for variant in (value, value.lower(), value.upper(), value.capitalize())}
     )
+)
+
 
+def csv_data_to_df(file_data: BinaryIO) -> pd.DataFrame:
     ingested_df = pd.read_csv(
         filepath_or_buffer=file_data,
         sep=",",
         encoding="utf-8",
         quotechar="'",
-        na_values=extra_na_values,
+        na_values=EXTRA_NA_VALUES,
         keep_default_na=True,
         dtype={**{col: str for col in HGVSColumns.options()}, "scores": float},
     )
@@ -0,0 +1,14 @@
+_like_escapes = str.maketrans({"\\": "\\\\", "%": "\\%", "_": "\\_"})
+
+
+def contains_pattern(text: str) -> str:
+    """
+    Build a LIKE pattern matching any value that contains the given text.
+
+    Backslashes and the LIKE wildcards % and _ are escaped with backslashes, which is PostgreSQL's default escape
+    character, so that they only match themselves.
+
+    :param text: The text to search for
+    :return: A pattern suitable for LIKE or ILIKE
+    """
+    return f"%{text.translate(_like_escapes)}%"
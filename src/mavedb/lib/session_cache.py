@@ -0,0 +1,27 @@
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session, SessionTransaction
+
+SESSION_CACHE_KEY = "mavedb_lookup_cache"
+
+
+def session_cache(db: Session, name: str) -> dict[Any, Any]:
+    """
+    Return a dictionary for memoizing lookups of the given kind for the rest of the session's current transaction.
+
+    This avoids repeating the same lookup (and any external requests it makes) when one request refers to a record
+    several times, without needing to invalidate anything across requests. The cache is discarded whenever the session's
+    transaction ends, since committing, rolling back or closing the session may expire or detach the objects it holds.
+
+    :param db: An active database session
+    :param name: The kind of lookup being cached
+    :return: A dictionary stored on the session
+    """
+    return db.info.setdefault(SESSION_CACHE_KEY, {}).setdefault(name, {})
+
+
+@event.listens_for(Session, "after_transaction_end")
+def clear_session_cache(session: Session, transaction: SessionTransaction):
+    if transaction.parent is None:
+        session.info.pop(SESSION_CACHE_KEY, None)
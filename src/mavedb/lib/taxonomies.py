@@ -3,6 +3,7 @@ from fastapi.exceptions import HTTPException
 from sqlalchemy.orm import Session
 from typing import Any
 
+from mavedb.lib.session_cache import session_cache
 from mavedb.models.taxonomy import Taxonomy
 from mavedb.view_models.taxonomy import TaxonomyCreate
 
@@ -15,9 +16,14 @@ async def find_or_create_taxonomy(db: Session, taxonomy: TaxonomyCreate):
     :param tax_id: A valid taxonomy ID from NCBI
     :return: An existing Taxonomy containing the specified taxonomy ID, or a new, unsaved Taxonomy
     """
+    cache = session_cache(db, "taxonomies")
+    if taxonomy.tax_id in cache:
+        return cache[taxonomy.tax_id]
+
     taxonomy_record = db.query(Taxonomy).filter(Taxonomy.tax_id == taxonomy.tax_id).one_or_none()
     if not taxonomy_record:
         taxonomy_record = await search_NCBI_taxonomy(db, str(taxonomy.tax_id))
+    cache[taxonomy.tax_id] = taxonomy_record
     return taxonomy_record
 
 
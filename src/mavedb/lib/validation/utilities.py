@@ -3,9 +3,11 @@ from typing import Optional, SupportsIndex
 
 from mavedb.lib.validation.constants.conversion import codon_dict_DNA
 from mavedb.lib.validation.constants.conversion import aa_dict_key_1
-from mavedb.lib.validation.constants.general import null_values_re
+from mavedb.lib.validation.constants.general import null_values_list
 from mavehgvs.variant import Variant
 
+null_values_set = frozenset(null_values_list)
+
 
 def is_null(value):
     """
@@ -19,17 +21,11 @@ def is_null(value):
     Returns
     _______
     bool
-        True value is NoneType or if value matches the stated regex patterns in constants.null_values_re.
+        True value is NoneType or if value is one of the null values in constants.null_values_list.
     """
     value = str(value).strip().lower()
-    if not value:
-        return True
-    match = null_values_re.fullmatch(value)
-    if match:
-        return True
-    else:
-        return False
-    # return null_values_re.fullmatch(value) or not value
+    # Once stripped, whitespace-only values are empty, so a set lookup covers everything null_values_re matches.
+    return not value or value in null_values_set
 
 
 def generate_hgvs(prefix: str = "c") -> str:
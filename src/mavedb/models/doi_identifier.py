@@ -1,12 +1,26 @@
 from datetime import date
+from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, Date, Integer, String
+from sqlalchemy import Column, Date, Index, Integer, String
+from sqlalchemy.orm import Mapped, relationship
 
 from mavedb.db.base import Base
 
+if TYPE_CHECKING:
+    from mavedb.models.experiment import Experiment
+
 
 class DoiIdentifier(Base):
     __tablename__ = "doi_identifiers"
+    __table_args__ = (
+        # Trigram index supporting case-insensitive substring search (requires the pg_trgm extension).
+        Index(
+            "ix_doi_identifiers_identifier_trgm",
+            "identifier",
+            postgresql_using="gin",
+            postgresql_ops={"identifier": "gin_trgm_ops"},
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
     identifier = Column(String, nullable=False)
@@ -15,3 +29,7 @@ class DoiIdentifier(Base):
     url = Column(String, nullable=True)
     creation_date = Column(Date, nullable=False, default=date.today)
     modification_date = Column(Date, nullable=False, default=date.today, onupdate=date.today)
+
+    experiments: Mapped[list["Experiment"]] = relationship(
+        "Experiment", secondary="experiment_doi_identifiers", back_populates="doi_identifiers", lazy="raise"
+    )
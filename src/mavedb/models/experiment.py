@@ -1,8 +1,6 @@
-from datetime import date
-
 from typing import Optional, List, TYPE_CHECKING
 
-from sqlalchemy import Boolean, Column, Date, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, Date, ForeignKey, func, Integer, String
 from sqlalchemy.event import listens_for
 from sqlalchemy.ext.associationproxy import association_proxy, AssociationProxy
 from sqlalchemy.orm import relationship, Mapped
@@ -10,6 +8,7 @@ from sqlalchemy.schema import Table
 from sqlalchemy.dialects.postgresql import JSONB
 
 from mavedb.db.base import Base
+from mavedb.lib.keywords import find_or_create_keywords
 from mavedb.lib.temp_urns import generate_temp_urn
 from mavedb.models.experiment_set import ExperimentSet
 from mavedb.models.keyword import Keyword
@@ -25,7 +24,7 @@ if TYPE_CHECKING:
 experiments_doi_identifiers_association_table = Table(
     "experiment_doi_identifiers",
     Base.metadata,
-    Column("experiment_id", ForeignKey("experiments.id"), primary_key=True),
+    Column("experiment_id", ForeignKey("experiments.id", ondelete="CASCADE"), primary_key=True),
     Column("doi_identifier_id", ForeignKey("doi_identifiers.id"), primary_key=True),
 )
 
@@ -33,7 +32,7 @@ experiments_doi_identifiers_association_table = Table(
 experiments_keywords_association_table = Table(
     "experiment_keywords",
     Base.metadata,
-    Column("experiment_id", ForeignKey("experiments.id"), primary_key=True),
+    Column("experiment_id", ForeignKey("experiments.id", ondelete="CASCADE"), primary_key=True),
     Column("keyword_id", ForeignKey("keywords.id"), primary_key=True),
 )
 
@@ -42,7 +41,7 @@ experiments_keywords_association_table = Table(
 experiments_raw_read_identifiers_association_table = Table(
     "experiment_sra_identifiers",
     Base.metadata,
-    Column("experiment_id", ForeignKey("experiments.id"), primary_key=True),
+    Column("experiment_id", ForeignKey("experiments.id", ondelete="CASCADE"), primary_key=True),
     Column("sra_identifier_id", ForeignKey("sra_identifiers.id"), primary_key=True),
 )
 
@@ -66,7 +65,9 @@ class Experiment(Base):
 
     # TODO Remove this obsolete column.
     num_score_sets = Column("num_scoresets", Integer, nullable=False, default=0)
-    score_sets: Mapped[List["ScoreSet"]] = relationship(back_populates="experiment", cascade="all, delete-orphan")
+    score_sets: Mapped[List["ScoreSet"]] = relationship(
+        back_populates="experiment", cascade="all, delete-orphan", lazy="selectin"
+    )
 
     experiment_set_id = Column(Integer, ForeignKey("experiment_sets.id"), index=True, nullable=True)
     experiment_set: Mapped[Optional[ExperimentSet]] = relationship(back_populates="experiments")
@@ -75,14 +76,22 @@ class Experiment(Base):
     created_by: Mapped[User] = relationship("User", foreign_keys="Experiment.created_by_id")
     modified_by_id = Column(Integer, ForeignKey("users.id"), index=True, nullable=True)
     modified_by: Mapped[User] = relationship("User", foreign_keys="Experiment.modified_by_id")
-    creation_date = Column(Date, nullable=False, default=date.today)
-    modification_date = Column(Date, nullable=False, default=date.today, onupdate=date.today)
+    creation_date = Column(Date, nullable=False, server_default=func.current_date())
+    modification_date = Column(Date, nullable=False, server_default=func.current_date(), onupdate=func.current_date())
 
     keyword_objs: Mapped[list[Keyword]] = relationship(
-        "Keyword", secondary=experiments_keywords_association_table, backref="experiments"
+        "Keyword",
+        secondary=experiments_keywords_association_table,
+        back_populates="experiments",
+        lazy="selectin",
+        passive_deletes=True,
     )
     doi_identifiers: Mapped[list[DoiIdentifier]] = relationship(
-        "DoiIdentifier", secondary=experiments_doi_identifiers_association_table, backref="experiments"
+        "DoiIdentifier",
+        secondary=experiments_doi_identifiers_association_table,
+        back_populates="experiments",
+        lazy="selectin",
+        passive_deletes=True,
     )
     publication_identifier_associations: Mapped[list[ExperimentPublicationIdentifierAssociation]] = relationship(
         "ExperimentPublicationIdentifierAssociation", back_populates="experiment", cascade="all, delete-orphan"
@@ -95,7 +104,11 @@ class Experiment(Base):
 
     # sra_identifiers = relationship('SraIdentifier', secondary=experiments_sra_identifiers_association_table, backref='experiments')
     raw_read_identifiers: Mapped[list[RawReadIdentifier]] = relationship(
-        "RawReadIdentifier", secondary=experiments_raw_read_identifiers_association_table, backref="experiments"
+        "RawReadIdentifier",
+        secondary=experiments_raw_read_identifiers_association_table,
+        back_populates="experiments",
+        lazy="selectin",
+        passive_deletes=True,
     )
 
     # Unfortunately, we can't use association_proxy here, because in spite of what the documentation seems to imply, it
@@ -117,20 +130,13 @@ class Experiment(Base):
         if keywords is None:
             self.keyword_objs = []
         else:
-            self.keyword_objs = [await self._find_or_create_keyword(db, text) for text in keywords]
+            self.keyword_objs = find_or_create_keywords(db, keywords)
 
     # See https://gist.github.com/tachyondecay/e0fe90c074d6b6707d8f1b0b1dcc8e3a
     # @keywords.setter
     # async def set_keywords(self, db, keywords: list[str]):
     #     self._keyword_objs = [await self._find_or_create_keyword(text) for text in keywords]
 
-    async def _find_or_create_keyword(self, db, keyword_text):
-        keyword_obj = db.query(Keyword).filter(Keyword.text == keyword_text).one_or_none()
-        if not keyword_obj:
-            keyword_obj = Keyword(text=keyword_text)
-            # object_session.add(keyword_obj)
-        return keyword_obj
-
 
 @listens_for(Experiment, "before_insert")
 def create_parent_object(mapper, connect, target):
@@ -19,4 +19,5 @@ class ExperimentPublicationIdentifierAssociation(Base):
     primary = Column(Boolean, nullable=True, default=False)
 
     experiment: Mapped["Experiment"] = relationship("Experiment", back_populates="publication_identifier_associations")
-    publication: Mapped["PublicationIdentifier"] = relationship("PublicationIdentifier")
+    # An association is only ever read for its publication, so load the two together.
+    publication: Mapped["PublicationIdentifier"] = relationship("PublicationIdentifier", lazy="joined")
@@ -1,9 +1,14 @@
 from datetime import date
+from typing import TYPE_CHECKING
 
 from sqlalchemy import Column, Date, Integer, String
+from sqlalchemy.orm import Mapped, relationship
 
 from mavedb.db.base import Base
 
+if TYPE_CHECKING:
+    from mavedb.models.experiment import Experiment
+
 
 class Keyword(Base):
     __tablename__ = "keywords"
@@ -12,3 +17,8 @@ class Keyword(Base):
     text = Column(String, nullable=False, unique=True)
     creation_date = Column(Date, nullable=False, default=date.today)
     modification_date = Column(Date, nullable=False, default=date.today, onupdate=date.today)
+
+    # Rarely traversed, so accidental access raises rather than silently loading every experiment.
+    experiments: Mapped[list["Experiment"]] = relationship(
+        "Experiment", secondary="experiment_keywords", back_populates="keyword_objs", lazy="raise"
+    )
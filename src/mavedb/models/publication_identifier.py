@@ -1,6 +1,6 @@
 from datetime import date
 
-from sqlalchemy import Column, Date, Integer, String
+from sqlalchemy import Column, Date, Index, Integer, String
 from sqlalchemy.dialects.postgresql import JSONB
 
 from mavedb.db.base import Base
@@ -8,6 +8,21 @@ from mavedb.db.base import Base
 
 class PublicationIdentifier(Base):
     __tablename__ = "publication_identifiers"
+    __table_args__ = (
+        Index(
+            "ix_publication_identifiers_identifier_trgm",
+            "identifier",
+            postgresql_using="gin",
+            postgresql_ops={"identifier": "gin_trgm_ops"},
+        ),
+        Index(
+            "ix_publication_identifiers_doi_trgm",
+            "doi",
+            postgresql_using="gin",
+            postgresql_ops={"doi": "gin_trgm_ops"},
+        ),
+        Index("ix_publication_identifiers_identifier_db_name", "identifier", "db_name"),
+    )
 
     id = Column(Integer, primary_key=True)
     identifier = Column(String, nullable=False)
@@ -1,9 +1,13 @@
-from datetime import date
+from typing import TYPE_CHECKING
 
-from sqlalchemy import Column, Date, Integer, String
+from sqlalchemy import Column, Date, func, Integer, String
+from sqlalchemy.orm import Mapped, relationship
 
 from mavedb.db.base import Base
 
+if TYPE_CHECKING:
+    from mavedb.models.experiment import Experiment
+
 
 class RawReadIdentifier(Base):
     __tablename__ = "sra_identifiers"
@@ -13,5 +17,9 @@ class RawReadIdentifier(Base):
     db_name = Column(String, nullable=False)
     db_version = Column(String, nullable=True)
     url = Column(String, nullable=True)
-    creation_date = Column(Date, nullable=False, default=date.today)
-    modification_date = Column(Date, nullable=False, default=date.today, onupdate=date.today)
+    creation_date = Column(Date, nullable=False, server_default=func.current_date())
+    modification_date = Column(Date, nullable=False, server_default=func.current_date(), onupdate=func.current_date())
+
+    experiments: Mapped[list["Experiment"]] = relationship(
+        "Experiment", secondary="experiment_sra_identifiers", back_populates="raw_read_identifiers", lazy="raise"
+    )
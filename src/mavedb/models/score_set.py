@@ -1,5 +1,5 @@
 from datetime import date
-from sqlalchemy import Boolean, Column, Date, Enum, ForeignKey, Integer, String
+from sqlalchemy import Boolean, Column, Date, Enum, ForeignKey, Index, Integer, String, text
 from sqlalchemy.orm import relationship, backref, Mapped
 from sqlalchemy.ext.associationproxy import association_proxy, AssociationProxy
 from sqlalchemy.schema import Table
@@ -23,6 +23,7 @@ if TYPE_CHECKING:
     from mavedb.models.target_gene import TargetGene
 
 # from .raw_read_identifier import SraIdentifier
+from mavedb.lib.keywords import find_or_create_keywords
 from mavedb.lib.temp_urns import generate_temp_urn
 
 # TODO Reformat code without removing dependencies whose use is not detected.
@@ -62,6 +63,14 @@ score_sets_raw_read_identifiers_association_table = Table(
 
 class ScoreSet(Base):
     __tablename__ = "scoresets"
+    __table_args__ = (
+        Index(
+            "ix_scoresets_published",
+            "id",
+            postgresql_include=["published_date"],
+            postgresql_where=text("published_date IS NOT NULL"),
+        ),
+    )
 
     id = Column(Integer, primary_key=True)
 
@@ -134,7 +143,14 @@ class ScoreSet(Base):
         secondary=score_sets_meta_analysis_score_sets_association_table,
         primaryjoin=(score_sets_meta_analysis_score_sets_association_table.c.meta_analysis_scoreset_id == id),
         secondaryjoin=(score_sets_meta_analysis_score_sets_association_table.c.source_scoreset_id == id),
-        backref="meta_analyzed_by_score_sets",
+        back_populates="meta_analyzed_by_score_sets",
+    )
+    meta_analyzed_by_score_sets: Mapped[list["ScoreSet"]] = relationship(
+        "ScoreSet",
+        secondary=score_sets_meta_analysis_score_sets_association_table,
+        primaryjoin=(score_sets_meta_analysis_score_sets_association_table.c.source_scoreset_id == id),
+        secondaryjoin=(score_sets_meta_analysis_score_sets_association_table.c.meta_analysis_scoreset_id == id),
+        back_populates="meta_analyzes_score_sets",
     )
 
     target_genes: Mapped[List["TargetGene"]] = relationship(back_populates="score_set", cascade="all, delete-orphan")
@@ -158,16 +174,9 @@ class ScoreSet(Base):
         if keywords is None:
             self.keyword_objs = []
         else:
-            self.keyword_objs = [await self._find_or_create_keyword(db, text) for text in keywords]
+            self.keyword_objs = find_or_create_keywords(db, keywords)
 
     # See https://gist.github.com/tachyondecay/e0fe90c074d6b6707d8f1b0b1dcc8e3a
     # @keywords.setter
     # async def set_keywords(self, db, keywords: list[str]):
     #     self._keyword_objs = [await self._find_or_create_keyword(text) for text in keywords]
-
-    async def _find_or_create_keyword(self, db, keyword_text):
-        keyword_obj = db.query(Keyword).filter(Keyword.text == keyword_text).one_or_none()
-        if not keyword_obj:
-            keyword_obj = Keyword(text=keyword_text)
-            # object_session.add(keyword_obj)
-        return keyword_obj
@@ -21,4 +21,4 @@ class ScoreSetPublicationIdentifierAssociation(Base):
     score_set: Mapped["ScoreSet"] = relationship(
         "mavedb.models.score_set.ScoreSet", back_populates="publication_identifier_associations"
     )
-    publication: Mapped["PublicationIdentifier"] = relationship("PublicationIdentifier")
+    publication: Mapped["PublicationIdentifier"] = relationship("PublicationIdentifier", lazy="joined")
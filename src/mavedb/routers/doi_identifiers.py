@@ -1,10 +1,10 @@
 from typing import Any, List
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from mavedb import deps
+from mavedb.lib.search import contains_pattern
 from mavedb.models.doi_identifier import DoiIdentifier
 from mavedb.view_models import doi_identifier
 from mavedb.view_models.search import TextSearch
@@ -20,11 +20,10 @@ def search_doi_identifiers(search: TextSearch, db: Session = Depends(deps.get_db
     Search DOI identifiers.
     """
 
-    query = db.query(DoiIdentifier)
+    query = db.query(DoiIdentifier).options(raiseload("*"))
 
     if search.text and len(search.text.strip()) > 0:
-        lower_search_text = search.text.strip().lower()
-        query = query.filter(func.lower(DoiIdentifier.identifier).contains(lower_search_text))
+        query = query.filter(DoiIdentifier.identifier.ilike(contains_pattern(search.text.strip())))
     else:
         raise HTTPException(status_code=500, detail="Search text is required")
 
@@ -4,23 +4,32 @@ from typing import Any, Optional
 
 from fastapi import APIRouter, Depends, HTTPException
 from fastapi.encoders import jsonable_encoder
+from fastapi.responses import ORJSONResponse, Response
 from sqlalchemy import or_, and_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, raiseload
 
 from mavedb import deps
 from mavedb.lib.authentication import get_current_user, UserData
 from mavedb.lib.authentication import get_current_user
 from mavedb.lib.authorization import require_current_user, require_current_user_with_email
-from mavedb.lib.experiments import search_experiments as _search_experiments
+from mavedb.lib.caching import invalidate_on_write, TTLCache
+from mavedb.lib.experiments import experiment_loader_options, search_experiments as _search_experiments
 from mavedb.lib.identifiers import (
-    find_or_create_doi_identifier,
+    find_or_create_doi_identifiers,
     find_or_create_publication_identifier,
-    find_or_create_raw_read_identifier,
+    find_or_create_raw_read_identifiers,
 )
 from mavedb.lib.permissions import assert_permission, Action
+from mavedb.lib.score_sets import score_set_loader_options
+from mavedb.models.doi_identifier import DoiIdentifier
 from mavedb.models.experiment import Experiment
+from mavedb.models.experiment_publication_identifier import ExperimentPublicationIdentifierAssociation
 from mavedb.models.experiment_set import ExperimentSet
+from mavedb.models.keyword import Keyword
+from mavedb.models.publication_identifier import PublicationIdentifier
+from mavedb.models.raw_read_identifier import RawReadIdentifier
 from mavedb.models.score_set import ScoreSet
+from mavedb.models.user import User
 from mavedb.view_models import experiment, score_set
 from mavedb.view_models.search import ExperimentsSearch
 
@@ -30,6 +39,24 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1", tags=["experiments"], responses={404: {"description": "Not found"}})
 
+# Serialized experiment listings, keyed by the ID of the user whose experiments were listed (or None for all of them).
+# Of users, only the names shown as creators and modifiers are listed, so logging in does not clear the cache.
+EXPERIMENT_LIST_CACHE_TTL = 60
+experiment_list_cache = invalidate_on_write(
+    TTLCache(ttl=EXPERIMENT_LIST_CACHE_TTL),
+    Experiment,
+    ExperimentSet,
+    ScoreSet,
+    Keyword,
+    DoiIdentifier,
+    RawReadIdentifier,
+    PublicationIdentifier,
+    ExperimentPublicationIdentifierAssociation,
+    User.username,
+    User.first_name,
+    User.last_name,
+)
+
 
 @router.get(
     "/experiments/", status_code=200, response_model=list[experiment.Experiment], response_model_exclude_none=True
@@ -40,22 +67,29 @@ def list_experiments(
     q: Optional[str] = None,
     db: Session = Depends(deps.get_db),
     user_data: UserData = Depends(get_current_user),
-) -> list[Experiment]:
+) -> Any:
     """
     List experiments.
     """
-    query = db.query(Experiment)
-    if q is not None:
-        if user_data is None:
-            return []
-        if len(q) > 0:
-            query = query.filter(
-                Experiment.created_by_id == user_data.user.id
-            )  # .filter(Experiment.published_date is None)
-        # else:
-        #     query = query.filter(Experiment.created_by_id == user.id).filter(Experiment.published_date is None)
+    if q is not None and user_data is None:
+        return []
+    owner_id = user_data.user.id if q else None
+
+    cached_body = experiment_list_cache.get(owner_id)
+    if cached_body is not None:
+        return Response(content=cached_body, media_type="application/json")
+
+    # Anything serialized must be covered by the loader options, so that listing never falls back to per-row queries.
+    query = db.query(Experiment).options(*experiment_loader_options, raiseload("*"))
+    if owner_id is not None:
+        query = query.filter(Experiment.created_by_id == owner_id)  # .filter(Experiment.published_date is None)
     items = query.order_by(Experiment.urn).all()
-    return items
+
+    # Serialize the response the way FastAPI would, so that it can be cached and returned without repeating the work.
+    content = jsonable_encoder([experiment.Experiment.from_orm(item) for item in items], exclude_none=True)
+    body = ORJSONResponse(content=content).body
+    experiment_list_cache.set(owner_id, body)
+    return Response(content=body, media_type="application/json")
 
 
 @router.post("/experiments/search", status_code=200, response_model=list[experiment.ShortExperiment])
@@ -93,7 +127,7 @@ def fetch_experiment(
     Fetch a single experiment by URN.
     """
     # item = db.query(Experiment).filter(Experiment.urn == urn).filter(Experiment.private.is_(False)).first()
-    item = db.query(Experiment).filter(Experiment.urn == urn).first()
+    item = db.query(Experiment).options(*experiment_loader_options).filter(Experiment.urn == urn).first()
     if not item:
         raise HTTPException(status_code=404, detail=f"Experiment with URN {urn} not found")
     assert_permission(user_data, item, Action.READ)
@@ -125,7 +159,11 @@ def get_experiment_score_sets(
     #
     # TODO(#182): A side effect of this implementation is that only the user who has created the experiment may view all the Score sets
     # associated with a given experiment. This could be solved with user impersonation for certain user roles.
-    score_sets = db.query(ScoreSet).filter(ScoreSet.experiment_id == experiment.id)
+    score_sets = (
+        db.query(ScoreSet)
+        .options(*score_set_loader_options, raiseload("*"))
+        .filter(ScoreSet.experiment_id == experiment.id)
+    )
     if user_data is not None:
         score_set_result = score_sets.filter(
             or_(ScoreSet.private.is_(False), and_(ScoreSet.private.is_(True), ScoreSet.created_by == user_data.user))
@@ -165,14 +203,12 @@ async def create_experiment(
             )
         assert_permission(user_data, experiment_set, Action.ADD_EXPERIMENT)
     try:
-        doi_identifiers = [
-            await find_or_create_doi_identifier(db, identifier.identifier)
-            for identifier in item_create.doi_identifiers or []
-        ]
-        raw_read_identifiers = [
-            await find_or_create_raw_read_identifier(db, identifier.identifier)
-            for identifier in item_create.raw_read_identifiers or []
-        ]
+        doi_identifiers = await find_or_create_doi_identifiers(
+            db, [identifier.identifier for identifier in item_create.doi_identifiers or []]
+        )
+        raw_read_identifiers = await find_or_create_raw_read_identifiers(
+            db, [identifier.identifier for identifier in item_create.raw_read_identifiers or []]
+        )
         primary_publication_identifiers = [
             await find_or_create_publication_identifier(db, identifier.identifier, identifier.db_name)
             for identifier in item_create.primary_publication_identifiers or []
@@ -193,9 +229,7 @@ async def create_experiment(
         setattr(publication, "primary", publication.identifier in primary_identifiers)
 
     item = Experiment(
-        **jsonable_encoder(
-            item_create,
-            by_alias=False,
+        **item_create.dict(
             exclude={
                 "doi_identifiers",
                 "experiment_set_urn",
@@ -255,14 +289,12 @@ async def update_experiment(
     for var, value in pairs.items():  # vars(item_update).items():
         setattr(item, var, value) if value else None
 
-    doi_identifiers = [
-        await find_or_create_doi_identifier(db, identifier.identifier)
-        for identifier in item_update.doi_identifiers or []
-    ]
-    raw_read_identifiers = [
-        await find_or_create_raw_read_identifier(db, identifier.identifier)
-        for identifier in item_update.raw_read_identifiers or []
-    ]
+    doi_identifiers = await find_or_create_doi_identifiers(
+        db, [identifier.identifier for identifier in item_update.doi_identifiers or []]
+    )
+    raw_read_identifiers = await find_or_create_raw_read_identifiers(
+        db, [identifier.identifier for identifier in item_update.raw_read_identifiers or []]
+    )
 
     primary_publication_identifiers = [
         await find_or_create_publication_identifier(db, identifier.identifier, identifier.db_name)
@@ -292,7 +324,7 @@ async def update_experiment(
 
 
 @router.delete("/experiments/{urn}", response_model=None, responses={422: {}})
-async def delete_experiment(
+def delete_experiment(
     *,
     urn: str,
     db: Session = Depends(deps.get_db),
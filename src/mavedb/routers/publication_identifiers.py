@@ -1,12 +1,18 @@
-from typing import Any, List
+from functools import lru_cache
+from typing import Any, Iterable, Iterator, List
 
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, or_
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response, StreamingResponse
+from sqlalchemy import and_, bindparam, or_, select, Select
 from sqlalchemy.exc import MultipleResultsFound
+from sqlalchemy.engine import RowMapping
 from sqlalchemy.orm import Session
 
 from mavedb import deps
+from mavedb.lib.caching import conditional_json_response, invalidate_on_write, json_body_with_etag, TTLCache
 from mavedb.lib.identifiers import find_generic_article, find_or_create_publication_identifier
+from mavedb.lib.search import contains_pattern
 from mavedb.models.publication_identifier import PublicationIdentifier
 from mavedb.view_models import publication_identifier
 from mavedb.view_models.search import TextSearch
@@ -17,14 +23,94 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Journal and database names change rarely, so their lists are cached briefly along with their ETags.
+PUBLICATION_NAME_LIST_CACHE_TTL = 60
+publication_name_list_cache = invalidate_on_write(
+    TTLCache(ttl=PUBLICATION_NAME_LIST_CACHE_TTL, maxsize=2), PublicationIdentifier
+)
+
+
+# The columns read by the publication identifier view model. Read-only listings select these as plain rows, which
+# avoids building and tracking an ORM object for every publication.
+publication_list_columns = (
+    PublicationIdentifier.id,
+    PublicationIdentifier.identifier,
+    PublicationIdentifier.db_name,
+    PublicationIdentifier.title,
+    PublicationIdentifier.abstract,
+    PublicationIdentifier.authors,
+    PublicationIdentifier.doi,
+    PublicationIdentifier.publication_year,
+    PublicationIdentifier.publication_journal,
+    PublicationIdentifier.url,
+    PublicationIdentifier.reference_html,
+)
+
+
+def _publications_to_json(rows: Iterable[RowMapping]) -> bytes:
+    """
+    Serialize publication rows as comma-separated JSON objects, going straight from the view model's dictionary to
+    orjson rather than through FastAPI's jsonable_encoder.
+    """
+    return b",".join(
+        orjson.dumps(publication_identifier.PublicationIdentifier.parse_obj(row).dict(by_alias=True)) for row in rows
+    )
+
+
+def _stream_publications_as_json(db: Session, batch_size: int = 500) -> Iterator[bytes]:
+    # Publications are fetched through a server-side cursor and serialized a batch at a time, so memory use stays
+    # bounded by the batch size rather than the number of stored publications.
+    query = select(*publication_list_columns).execution_options(yield_per=batch_size)
+
+    separator = b""
+    yield b"["
+    for publications in db.execute(query).mappings().partitions():
+        yield separator + _publications_to_json(publications)
+        separator = b","
+    yield b"]"
+
 
 @router.get("/", status_code=200, response_model=list[publication_identifier.PublicationIdentifier])
 def list_publications(*, db: Session = Depends(deps.get_db)) -> Any:
     """
     List stored all stored publications.
     """
-    items = db.query(PublicationIdentifier).all()
-    return items
+    return StreamingResponse(_stream_publications_as_json(db), media_type="application/json")
+
+
+@router.get("/journals", status_code=200, response_model=list[str], responses={404: {}})
+def list_publication_journal_names(*, request: Request, db: Session = Depends(deps.get_db)) -> Any:
+    """
+    List distinct journal names, in alphabetical order.
+    """
+    cached = publication_name_list_cache.get("journals")
+    if cached is None:
+        journals = db.scalars(
+            select(PublicationIdentifier.publication_journal)
+            .where(PublicationIdentifier.publication_journal.is_not(None))
+            .distinct()
+            .order_by(PublicationIdentifier.publication_journal)
+        ).all()
+        cached = json_body_with_etag(journals)
+        publication_name_list_cache.set("journals", cached)
+
+    return conditional_json_response(request, *cached)
+
+
+@router.get("/databases", status_code=200, response_model=list[str], responses={404: {}})
+def list_publication_database_names(*, request: Request, db: Session = Depends(deps.get_db)) -> Any:
+    """
+    List distinct database names, in alphabetical order.
+    """
+    cached = publication_name_list_cache.get("databases")
+    if cached is None:
+        databases = db.scalars(
+            select(PublicationIdentifier.db_name).distinct().order_by(PublicationIdentifier.db_name)
+        ).all()
+        cached = json_body_with_etag(databases)
+        publication_name_list_cache.set("databases", cached)
+
+    return conditional_json_response(request, *cached)
 
 
 @router.get(
@@ -68,7 +154,7 @@ def fetch_publication_by_dbname_and_identifier(
     try:
         item = (
             db.query(PublicationIdentifier)
-            .filter(PublicationIdentifier.identifier == identifier and PublicationIdentifier.db_name == db_name)
+            .filter(and_(PublicationIdentifier.identifier == identifier, PublicationIdentifier.db_name == db_name))
             .one_or_none()
         )
     except MultipleResultsFound:
@@ -84,26 +170,28 @@ def fetch_publication_by_dbname_and_identifier(
     return item
 
 
-@router.get("/journals", status_code=200, response_model=list[str], responses={404: {}})
-def list_publication_journal_names(*, db: Session = Depends(deps.get_db)) -> Any:
+@lru_cache
+def _text_search_statement(*column_names: str) -> Select:
     """
-    List distinct journal names, in alphabetical order.
+    Build, once per combination of columns, a statement matching publications whose values in any of the named columns
+    contain the bound "pattern" parameter, ignoring case.
     """
-
-    items = db.query(PublicationIdentifier).all()
-    journals = map(lambda item: item.publication_journal, items)
-    return sorted(list(set(journals)))
+    columns = [getattr(PublicationIdentifier, column_name) for column_name in column_names]
+    return (
+        select(*publication_list_columns)
+        .where(or_(*(column.ilike(bindparam("pattern")) for column in columns)))
+        .order_by(columns[0])
+        .limit(50)
+    )
 
 
-@router.get("/databases", status_code=200, response_model=list[str], responses={404: {}})
-def list_publication_database_names(*, db: Session = Depends(deps.get_db)) -> Any:
-    """
-    List distinct database names, in alphabetical order.
-    """
+def _search_publications(db: Session, search: TextSearch, *column_names: str) -> Response:
+    if not search.text or len(search.text.strip()) == 0:
+        raise HTTPException(status_code=500, detail="Search text is required")
 
-    items = db.query(PublicationIdentifier).all()
-    databases = map(lambda item: item.db_name, items)
-    return sorted(list(set(databases)))
+    pattern = contains_pattern(search.text.strip())
+    rows = db.execute(_text_search_statement(*column_names), {"pattern": pattern}).mappings()
+    return Response(content=b"[" + _publications_to_json(rows) + b"]", media_type="application/json")
 
 
 @router.post("/search/identifier", status_code=200, response_model=list[publication_identifier.PublicationIdentifier])
@@ -111,19 +199,7 @@ def search_publication_identifier_identifiers(search: TextSearch, db: Session =
     """
     Search publication identifiers via a TextSearch query.
     """
-
-    query = db.query(PublicationIdentifier)
-
-    if search.text and len(search.text.strip()) > 0:
-        lower_search_text = search.text.strip().lower()
-        query = query.filter(func.lower(PublicationIdentifier.identifier).contains(lower_search_text))
-    else:
-        raise HTTPException(status_code=500, detail="Search text is required")
-
-    items = query.order_by(PublicationIdentifier.identifier).limit(50).all()
-    if not items:
-        items = []
-    return items
+    return _search_publications(db, search, "identifier")
 
 
 @router.post("/search/doi", status_code=200, response_model=list[publication_identifier.PublicationIdentifier])
@@ -131,19 +207,7 @@ def search_publication_identifier_dois(search: TextSearch, db: Session = Depends
     """
     Search publication DOIs via a TextSearch query.
     """
-
-    query = db.query(PublicationIdentifier)
-
-    if search.text and len(search.text.strip()) > 0:
-        lower_search_text = search.text.strip().lower()
-        query = query.filter(func.lower(PublicationIdentifier.doi).contains(lower_search_text))
-    else:
-        raise HTTPException(status_code=500, detail="Search text is required")
-
-    items = query.order_by(PublicationIdentifier.doi).limit(50).all()
-    if not items:
-        items = []
-    return items
+    return _search_publications(db, search, "doi")
 
 
 @router.post("/search", status_code=200, response_model=list[publication_identifier.PublicationIdentifier])
@@ -151,24 +215,7 @@ def search_publication_identifiers(search: TextSearch, db: Session = Depends(dep
     """
     Search publication identifiers via a TextSearch query, returning substring matches on DOI and Identifier.
     """
-
-    query = db.query(PublicationIdentifier)
-
-    if search.text and len(search.text.strip()) > 0:
-        lower_search_text = search.text.strip().lower()
-        query = query.filter(
-            or_(
-                func.lower(PublicationIdentifier.identifier).contains(lower_search_text),
-                func.lower(PublicationIdentifier.doi).contains(lower_search_text),
-            )
-        )
-    else:
-        raise HTTPException(status_code=500, detail="Search text is required")
-
-    items = query.order_by(PublicationIdentifier.identifier).limit(50).all()
-    if not items:
-        items = []
-    return items
+    return _search_publications(db, search, "identifier", "doi")
 
 
 @router.get(
@@ -205,7 +252,7 @@ async def search_publications_by_identifier_and_db(
     """
     query = (
         db.query(PublicationIdentifier)
-        .filter(PublicationIdentifier.identifier == identifier and PublicationIdentifier.db_name == db_name)
+        .filter(and_(PublicationIdentifier.identifier == identifier, PublicationIdentifier.db_name == db_name))
         .all()
     )
 
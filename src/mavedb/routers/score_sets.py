@@ -5,11 +5,11 @@ from typing import Any, List, Optional
 import pandas as pd
 from arq import ArqRedis
 from fastapi import APIRouter, Depends, File, status, UploadFile, Query
-from fastapi.encoders import jsonable_encoder
+from fastapi.concurrency import run_in_threadpool
 from fastapi.exceptions import HTTPException
 from fastapi.responses import StreamingResponse
 from sqlalchemy import or_
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import load_only, Session
 from sqlalchemy.exc import MultipleResultsFound
 
 from mavedb import deps
@@ -17,18 +17,18 @@ from mavedb.lib.authentication import UserData
 from mavedb.lib.authorization import get_current_user, require_current_user, require_current_user_with_email
 from mavedb.lib.identifiers import (
     create_external_gene_identifier_offset,
-    find_or_create_doi_identifier,
+    find_or_create_doi_identifiers,
     find_or_create_publication_identifier,
 )
 from mavedb.lib.logging import LoggedRoute
 from mavedb.lib.permissions import Action, assert_permission
 from mavedb.lib.score_sets import (
     find_meta_analyses_for_experiment_sets,
-    get_score_set_counts_as_csv,
-    get_score_set_scores_as_csv,
+    stream_score_set_counts_as_csv,
+    stream_score_set_scores_as_csv,
     search_score_sets as _search_score_sets,
     csv_data_to_df,
-    variants_to_csv_rows,
+    variants_to_csv_df,
 )
 from mavedb.lib.taxonomies import find_or_create_taxonomy
 from mavedb.lib.urns import generate_experiment_set_urn, generate_experiment_urn, generate_score_set_urn
@@ -77,6 +77,19 @@ router = APIRouter(
     prefix="/api/v1", tags=["score sets"], responses={404: {"description": "not found"}}, route_class=LoggedRoute
 )
 
+# The CSV exports only need the columns read when checking permissions and building the header, so the score set's
+# remaining columns (including its large JSONB metadata) are not loaded.
+score_set_csv_loader_options = (
+    load_only(
+        ScoreSet.id,
+        ScoreSet.urn,
+        ScoreSet.private,
+        ScoreSet.published_date,
+        ScoreSet.created_by_id,
+        ScoreSet.dataset_columns,
+    ),
+)
+
 
 @router.post("/score-sets/search", status_code=200, response_model=list[score_set.ShortScoreSet])
 def search_score_sets(search: ScoreSetsSearch, db: Session = Depends(deps.get_db)) -> Any:  # = Body(..., embed=True),
@@ -147,13 +160,15 @@ def get_score_set_scores_csv(
     if limit != None and limit <= 0:
         raise HTTPException(status_code=400, detail="Limit must be positive")
 
-    score_set = db.query(ScoreSet).filter(ScoreSet.urn == urn).first()
+    score_set = db.query(ScoreSet).options(*score_set_csv_loader_options).filter(ScoreSet.urn == urn).first()
     if not score_set:
         raise HTTPException(status_code=404, detail=f"score set with URN '{urn}' not found")
     assert_permission(user_data, score_set, Action.READ)
+    # Until the worker has replaced them, the stored variants are those of the previous upload.
+    if score_set.processing_state == ProcessingState.processing:
+        raise HTTPException(status_code=409, detail=f"variants for score set with URN '{urn}' are being processed")
 
-    csv_str = get_score_set_scores_as_csv(db, score_set, start, limit)
-    return StreamingResponse(iter([csv_str]), media_type="text/csv")
+    return StreamingResponse(stream_score_set_scores_as_csv(db, score_set, start, limit), media_type="text/csv")
 
 
 @router.get(
@@ -167,7 +182,7 @@ def get_score_set_scores_csv(
         }
     },
 )
-async def get_score_set_counts_csv(
+def get_score_set_counts_csv(
     *,
     urn: str,
     start: int = Query(default=None, description="Start index for pagination"),
@@ -188,13 +203,15 @@ async def get_score_set_counts_csv(
     if limit != None and limit <= 0:
         raise HTTPException(status_code=400, detail="Limit must be positive")
 
-    score_set = db.query(ScoreSet).filter(ScoreSet.urn == urn).first()
+    score_set = db.query(ScoreSet).options(*score_set_csv_loader_options).filter(ScoreSet.urn == urn).first()
     if not score_set:
         raise HTTPException(status_code=404, detail=f"score set with URN {urn} not found")
     assert_permission(user_data, score_set, Action.READ)
+    # Until the worker has replaced them, the stored variants are those of the previous upload.
+    if score_set.processing_state == ProcessingState.processing:
+        raise HTTPException(status_code=409, detail=f"variants for score set with URN '{urn}' are being processed")
 
-    csv_str = get_score_set_counts_as_csv(db, score_set, start, limit)
-    return StreamingResponse(iter([csv_str]), media_type="text/csv")
+    return StreamingResponse(stream_score_set_counts_as_csv(db, score_set, start, limit), media_type="text/csv")
 
 
 @router.get("/score-sets/{urn}/mapped-variants", status_code=200, response_model=list[mapped_variant.MappedVariant])
@@ -317,10 +334,9 @@ async def create_score_set(
                 modified_by=user_data.user,
             )
 
-    doi_identifiers = [
-        await find_or_create_doi_identifier(db, identifier.identifier)
-        for identifier in item_create.doi_identifiers or []
-    ]
+    doi_identifiers = await find_or_create_doi_identifiers(
+        db, [identifier.identifier for identifier in item_create.doi_identifiers or []]
+    )
     primary_publication_identifiers = [
         await find_or_create_publication_identifier(db, identifier.identifier, identifier.db_name)
         for identifier in item_create.primary_publication_identifiers or []
@@ -354,16 +370,12 @@ async def create_score_set(
             # targets defined on a score set.
             seq_label = gene.target_sequence.label if gene.target_sequence.label is not None else gene.name
             target_sequence = TargetSequence(
-                **jsonable_encoder(gene.target_sequence, by_alias=False, exclude={"taxonomy", "label"}),
+                **gene.target_sequence.dict(exclude={"taxonomy", "label"}),
                 taxonomy=taxonomy,
                 label=seq_label,
             )
             target_gene = TargetGene(
-                **jsonable_encoder(
-                    gene,
-                    by_alias=False,
-                    exclude={"external_identifiers", "target_sequence", "target_accession"},
-                ),
+                **gene.dict(exclude={"external_identifiers", "target_sequence", "target_accession"}),
                 target_sequence=target_sequence,
             )
 
@@ -373,13 +385,9 @@ async def create_score_set(
                     "MaveDB does not support score-sets with both sequence and accession based targets. Please re-submit this scoreset using only one type of target."
                 )
             accessions = True
-            target_accession = TargetAccession(**jsonable_encoder(gene.target_accession, by_alias=False))
+            target_accession = TargetAccession(**gene.target_accession.dict())
             target_gene = TargetGene(
-                **jsonable_encoder(
-                    gene,
-                    by_alias=False,
-                    exclude={"external_identifiers", "target_sequence", "target_accession"},
-                ),
+                **gene.dict(exclude={"external_identifiers", "target_sequence", "target_accession"}),
                 target_accession=target_accession,
             )
         else:
@@ -397,9 +405,7 @@ async def create_score_set(
     assert experiment is not None
 
     item = ScoreSet(
-        **jsonable_encoder(
-            item_create,
-            by_alias=False,
+        **item_create.dict(
             exclude={
                 "doi_identifiers",
                 "experiment_urn",
@@ -459,17 +465,18 @@ async def upload_score_set_variant_data(
     assert_permission(user_data, item, Action.UPDATE)
     assert_permission(user_data, item, Action.SET_SCORES)
 
-    # Mark the score set as being processed and delete the old variants so that uploading new scores and counts won't accumulate the old ones.
+    # Mark the score set as being processed. The worker deletes the old variants before creating new ones, so that
+    # uploading new scores and counts won't accumulate the old ones.
     item.processing_state = ProcessingState.processing
-    db.query(Variant).filter(Variant.score_set_id == item.id).delete()
     db.add(item)
     db.commit()
     db.refresh(item)
 
-    scores_df = csv_data_to_df(scores_file.file)
+    # Parsing large files is CPU bound, so keep it off the event loop.
+    scores_df = await run_in_threadpool(csv_data_to_df, scores_file.file)
     counts_df = None
     if counts_file and counts_file.filename:
-        counts_df = csv_data_to_df(counts_file.file)
+        counts_df = await run_in_threadpool(csv_data_to_df, counts_file.file)
 
     if scores_file:
         # await the insertion of this job into the worker queue, not the job itself.
@@ -520,10 +527,9 @@ async def update_score_set(
             ]:
                 setattr(item, var, value) if value else None
 
-        item.doi_identifiers = [
-            await find_or_create_doi_identifier(db, identifier.identifier)
-            for identifier in item_update.doi_identifiers or []
-        ]
+        item.doi_identifiers = await find_or_create_doi_identifiers(
+            db, [identifier.identifier for identifier in item_update.doi_identifiers or []]
+        )
         primary_publication_identifiers = [
             await find_or_create_publication_identifier(db, identifier.identifier, identifier.db_name)
             for identifier in item_update.primary_publication_identifiers or []
@@ -575,16 +581,12 @@ async def update_score_set(
                 # targets defined on a score set.
                 seq_label = gene.target_sequence.label if gene.target_sequence.label is not None else gene.name
                 target_sequence = TargetSequence(
-                    **jsonable_encoder(gene.target_sequence, by_alias=False, exclude={"taxonomy", "label"}),
+                    **gene.target_sequence.dict(exclude={"taxonomy", "label"}),
                     taxonomy=taxonomy,
                     label=seq_label,
                 )
                 target_gene = TargetGene(
-                    **jsonable_encoder(
-                        gene,
-                        by_alias=False,
-                        exclude={"external_identifiers", "target_sequence", "target_accession"},
-                    ),
+                    **gene.dict(exclude={"external_identifiers", "target_sequence", "target_accession"}),
                     target_sequence=target_sequence,
                 )
 
@@ -594,13 +596,9 @@ async def update_score_set(
                         "MaveDB does not support score-sets with both sequence and accession based targets. Please re-submit this scoreset using only one type of target."
                     )
                 accessions = True
-                target_accession = TargetAccession(**jsonable_encoder(gene.target_accession, by_alias=False))
+                target_accession = TargetAccession(**gene.target_accession.dict())
                 target_gene = TargetGene(
-                    **jsonable_encoder(
-                        gene,
-                        by_alias=False,
-                        exclude={"external_identifiers", "target_sequence", "target_accession"},
-                    ),
+                    **gene.dict(exclude={"external_identifiers", "target_sequence", "target_accession"}),
                     target_accession=target_accession,
                 )
             else:
@@ -622,12 +620,15 @@ async def update_score_set(
             assert item.dataset_columns is not None
             score_columns = ["hgvs_nt", "hgvs_splice", "hgvs_pro"] + item.dataset_columns["score_columns"]
             count_columns = ["hgvs_nt", "hgvs_splice", "hgvs_pro"] + item.dataset_columns["count_columns"]
-            scores_data = pd.DataFrame(
-                variants_to_csv_rows(item.variants, columns=score_columns, dtype="score_data")
-            ).replace("NA", pd.NA)
-            count_data = pd.DataFrame(
-                variants_to_csv_rows(item.variants, columns=count_columns, dtype="count_data")
-            ).replace("NA", pd.NA)
+            scores_data = variants_to_csv_df(item.variants, columns=score_columns, dtype="score_data", na_rep=pd.NA)
+            count_data = variants_to_csv_df(item.variants, columns=count_columns, dtype="count_data", na_rep=pd.NA)
+
+            # As on upload, the old variants are kept until the worker replaces them, so mark them as being processed.
+            # Commit before queueing the job, so that the worker sees the new targets and its final state isn't
+            # overwritten when this update is committed.
+            item.processing_state = ProcessingState.processing
+            db.add(item)
+            db.commit()
 
             # await the insertion of this job into the worker queue, not the job itself.
             await worker.enqueue_job(
@@ -658,7 +659,7 @@ async def update_score_set(
 
 
 @router.delete("/score-sets/{urn}", responses={422: {}})
-async def delete_score_set(
+def delete_score_set(
     *,
     urn: str,
     db: Session = Depends(deps.get_db),
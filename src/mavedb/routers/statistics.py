@@ -1,10 +1,14 @@
 from enum import Enum
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, Table, select
+from functools import lru_cache
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import Response
+from sqlalchemy import func, literal, Table, select, union_all
 from sqlalchemy.orm import Session
-from typing import Any, Union
+from sqlalchemy.sql import Select
+from typing import Any, Callable, Union
 
 from mavedb.deps import get_db
+from mavedb.lib.caching import conditional_json_response, invalidate_on_write, json_body_with_etag, TTLCache
 from mavedb.models.doi_identifier import DoiIdentifier
 from mavedb.models.keyword import Keyword
 from mavedb.models.raw_read_identifier import RawReadIdentifier
@@ -41,6 +45,32 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
+# Statistics only change when records are created, edited or published, so responses are cached briefly by path along
+# with their ETags.
+STATISTICS_CACHE_TTL = 60
+statistics_cache = invalidate_on_write(
+    TTLCache(ttl=STATISTICS_CACHE_TTL, maxsize=32),
+    ScoreSet,
+    Experiment,
+    TargetGene,
+    TargetSequence,
+    TargetAccession,
+    Taxonomy,
+    EnsemblIdentifier,
+    EnsemblOffset,
+    RefseqIdentifier,
+    RefseqOffset,
+    UniprotIdentifier,
+    UniprotOffset,
+    Keyword,
+    DoiIdentifier,
+    RawReadIdentifier,
+    PublicationIdentifier,
+    ExperimentPublicationIdentifierAssociation,
+    ScoreSetPublicationIdentifierAssociation,
+    User.username,
+)
+
 ## Enum classes hold valid endpoints for different statistics routes.
 
 
@@ -77,6 +107,99 @@ class RecordFields(str, Enum):
     createdBy = "created-by"
 
 
+# Target accession and target sequence columns, keyed by their model and the statistics field naming them.
+# getattr obscures MyPy errors by coercing return type to Any
+TARGET_FIELD_COLUMNS: dict[tuple[type, Union[TargetAccessionFields, TargetSequenceFields]], Any] = {
+    **{
+        (TargetAccession, field): getattr(TargetAccession, field.value.replace("-", "_"))
+        for field in TargetAccessionFields
+    },
+    **{
+        (TargetSequence, field): getattr(TargetSequence, field.value.replace("-", "_"))
+        for field in TargetSequenceFields
+    },
+}
+
+# Target gene external identifier models and the offset models associating them with target genes.
+TARGET_GENE_IDENTIFIER_OFFSETS: dict[
+    TargetGeneFields, Union[type[EnsemblOffset], type[RefseqOffset], type[UniprotOffset]]
+] = {
+    TargetGeneFields.ensemblIdentifier: EnsemblOffset,
+    TargetGeneFields.refseqIdentifier: RefseqOffset,
+    TargetGeneFields.uniprotIdentifier: UniprotOffset,
+}
+
+TARGET_GENE_IDENTIFIER_MODELS: dict[
+    TargetGeneFields, Union[type[EnsemblIdentifier], type[RefseqIdentifier], type[UniprotIdentifier]]
+] = {
+    TargetGeneFields.ensemblIdentifier: EnsemblIdentifier,
+    TargetGeneFields.refseqIdentifier: RefseqIdentifier,
+    TargetGeneFields.uniprotIdentifier: UniprotIdentifier,
+}
+
+# Tables associating each record model with the values of its shared statistics fields.
+RECORD_ASSOCIATION_TABLES: dict[
+    RecordNames,
+    dict[
+        RecordFields,
+        Union[Table, type[ExperimentPublicationIdentifierAssociation], type[ScoreSetPublicationIdentifierAssociation]],
+    ],
+] = {
+    RecordNames.experiment: {
+        RecordFields.doiIdentifiers: experiments_doi_identifiers_association_table,
+        RecordFields.publicationIdentifiers: ExperimentPublicationIdentifierAssociation,
+        RecordFields.rawReadIdentifiers: experiments_raw_read_identifiers_association_table,
+        RecordFields.keywords: experiments_keywords_association_table,
+    },
+    RecordNames.scoreSet: {
+        RecordFields.doiIdentifiers: score_sets_doi_identifiers_association_table,
+        RecordFields.publicationIdentifiers: ScoreSetPublicationIdentifierAssociation,
+        RecordFields.rawReadIdentifiers: score_sets_raw_read_identifiers_association_table,
+        RecordFields.keywords: score_sets_keywords_association_table,
+    },
+}
+
+# Record models sharing statistics fields.
+RECORD_MODELS: dict[RecordNames, Union[type[Experiment], type[ScoreSet]]] = {
+    RecordNames.experiment: Experiment,
+    RecordNames.scoreSet: ScoreSet,
+}
+
+
+def _cached_statistic_response(request: Request, count: Callable[[], Any]) -> Response:
+    """
+    Respond with the statistic for the requested path, counting it only if no cached response is available.
+    """
+    cached = statistics_cache.get(request.url.path)
+    if cached is None:
+        cached = json_body_with_etag(count())
+        statistics_cache.set(request.url.path, cached)
+
+    return conditional_json_response(request, *cached)
+
+
+@lru_cache(maxsize=64)
+def _target_field_statement(
+    model: Union[type[TargetAccession], type[TargetSequence]],
+    field: Union[TargetAccessionFields, TargetSequenceFields],
+) -> Select:
+    """
+    Build the statement counting the distinct non-NULL values of a target accession or target sequence field.
+
+    Statements only depend on the model and field, so each one is built once and reused on later requests.
+    """
+    published_score_sets_stmt = select(ScoreSet).where(ScoreSet.published_date.is_not(None)).subquery()
+
+    column_field = TARGET_FIELD_COLUMNS[(model, field)]
+    return (
+        select(column_field, func.count(column_field))
+        .join(TargetGene)
+        .where(column_field.is_not(None))
+        .group_by(column_field)
+        .join_from(TargetGene, published_score_sets_stmt)
+    )
+
+
 def _target_from_field_and_model(
     db: Session,
     model: Union[type[TargetAccession], type[TargetSequence]],
@@ -88,172 +211,110 @@ def _target_from_field_and_model(
     """
     # Protection from this case occurs via FastApi/pydantic Enum validation on endpoints that reference this function.
     # If we are careful with our enumeration definitons, we should not end up here.
-    if (model == TargetAccession and field not in TargetAccessionFields) or (
-        model == TargetSequence and field not in TargetSequenceFields
-    ):
+    if (model, field) not in TARGET_FIELD_COLUMNS:
         raise HTTPException(422, f"Field `{field.name}` is incompatible with target model `{model}`.")
 
-    published_score_sets_stmt = select(ScoreSet).where(ScoreSet.published_date.is_not(None)).subquery()
-
-    # getattr obscures MyPy errors by coercing return type to Any
-    model_field = field.value.replace("-", "_")
-    column_field = getattr(model, model_field)
-    query = (
-        select(column_field, func.count(column_field))
-        .join(TargetGene)
-        .group_by(column_field)
-        .join_from(TargetGene, published_score_sets_stmt)
-    )
-
-    return db.execute(query).all()
+    return db.execute(_target_field_statement(model, field)).all()
 
 
 # Accession based targets only.
 @router.get("/target/accession/{field}", status_code=200, response_model=dict[str, int])
-def target_accessions_by_field(field: TargetAccessionFields, db: Session = Depends(get_db)) -> dict[str, int]:
+def target_accessions_by_field(field: TargetAccessionFields, request: Request, db: Session = Depends(get_db)) -> Any:
     """
     Returns a dictionary of counts for the distinct values of the provided `field` (member of the `target_accessions` table).
     Don't include any NULL field values.
     """
-    return {
-        field_val: count
-        for field_val, count in _target_from_field_and_model(db, TargetAccession, field)
-        if field_val is not None
-    }
+    return _cached_statistic_response(request, lambda: dict(_target_from_field_and_model(db, TargetAccession, field)))
 
 
 # Sequence based targets only.
 @router.get("/target/sequence/{field}", status_code=200, response_model=dict[str, int])
-def target_sequences_by_field(field: TargetSequenceFields, db: Session = Depends(get_db)) -> dict[str, int]:
+def target_sequences_by_field(field: TargetSequenceFields, request: Request, db: Session = Depends(get_db)) -> Any:
     """
     Returns a dictionary of counts for the distinct values of the provided `field` (member of the `target_sequences` table).
     Don't include any NULL field values.
     """
-    return {
-        field_val: count
-        for field_val, count in _target_from_field_and_model(db, TargetSequence, field)
-        if field_val is not None
-    }
+    return _cached_statistic_response(request, lambda: dict(_target_from_field_and_model(db, TargetSequence, field)))
 
 
-# Statistics on fields relevant to both accession and sequence based targets. Generally, these require custom logic to harmonize both target sub types.
-@router.get("/target/gene/{field}", status_code=200, response_model=dict[str, int])
-def target_genes_by_field(field: TargetGeneFields, db: Session = Depends(get_db)) -> dict[str, int]:
+@lru_cache(maxsize=64)
+def _target_gene_field_statement(field: TargetGeneFields) -> Select:
     """
-    Returns a dictionary of counts for the distinct values of the provided `field` (member of the `target_sequences` table).
-    Don't include any NULL field values. Each field here is handled individually because of the unique structure of this
-    target gene object- fields might require information from both TargetGene subtypes (accession and sequence).
+    Build the statement counting the distinct non-NULL values of a target gene field among published score sets.
+
+    Target gene organism needs special handling: it is stored differently between accession and sequence Targets, so
+    both kinds of target are combined into one list of organism names before counting them.
     """
-    association_tables: dict[TargetGeneFields, Union[type[EnsemblOffset], type[RefseqOffset], type[UniprotOffset]]] = {
-        TargetGeneFields.ensemblIdentifier: EnsemblOffset,
-        TargetGeneFields.refseqIdentifier: RefseqOffset,
-        TargetGeneFields.uniprotIdentifier: UniprotOffset,
-    }
-    identifier_models: dict[
-        TargetGeneFields, Union[type[EnsemblIdentifier], type[RefseqIdentifier], type[UniprotIdentifier]]
-    ] = {
-        TargetGeneFields.ensemblIdentifier: EnsemblIdentifier,
-        TargetGeneFields.refseqIdentifier: RefseqIdentifier,
-        TargetGeneFields.uniprotIdentifier: UniprotIdentifier,
-    }
 
     # All targets linked to a published score set.
     published_score_sets_stmt = select(TargetGene).join(ScoreSet).where(ScoreSet.published_date.is_not(None)).subquery()
 
     # Assumes identifiers cannot be duplicated within a Target.
-    if field in identifier_models.keys():
+    if field in TARGET_GENE_IDENTIFIER_MODELS:
         # getattr obscures MyPy errors by coercing return type to Any
-        attr_for_identifier = getattr(identifier_models[field], "identifier")
+        attr_for_identifier = getattr(TARGET_GENE_IDENTIFIER_MODELS[field], "identifier")
 
-        query = (
+        return (
             select(attr_for_identifier, func.count(attr_for_identifier))
-            .join(association_tables[field])
+            .join(TARGET_GENE_IDENTIFIER_OFFSETS[field])
             .join(published_score_sets_stmt)
+            .where(attr_for_identifier.is_not(None))
             .group_by(attr_for_identifier)
         )
 
-        return {identifier: count for identifier, count in db.execute(query).all() if identifier is not None}
-
     # Can't join a TargetGene query to TargetGene query, so just select the desired columns directly from the subquery.
     elif field is TargetGeneFields.category:
-        query = select(published_score_sets_stmt.c.category, func.count(published_score_sets_stmt.c.category)).group_by(
-            published_score_sets_stmt.c.category
+        return (
+            select(published_score_sets_stmt.c.category, func.count(published_score_sets_stmt.c.category))
+            .where(published_score_sets_stmt.c.category.is_not(None))
+            .group_by(published_score_sets_stmt.c.category)
         )
 
-        return {category: count for category, count in db.execute(query).all() if category is not None}
-
-    # Target gene organism needs special handling: it is stored differently between accession and sequence Targets.
     elif field is TargetGeneFields.organism:
-        sequence_based_targets_query = (
-            select(Taxonomy.organism_name, func.count(Taxonomy.organism_name))
-            .join(TargetSequence)
-            .join(published_score_sets_stmt)
-            .group_by(Taxonomy.organism_name)
-        )
-        accession_based_targets_query = select(func.count(TargetAccession.id)).join(published_score_sets_stmt)
-
-        organisms: dict[str, int] = {
-            organism: count
-            for organism, count in db.execute(sequence_based_targets_query).all()
-            if organism is not None
-        }
-        accession_count = db.execute(accession_based_targets_query).scalar_one_or_none()
-
         # NOTE: For now (forever?), all accession based targets are human genomic sequences. It is possible this
         #       assumption changes if we add mouse (or other non-human) genomes to MaveDB.
-        if "Homo sapiens" in organisms and accession_count:
-            organisms["Homo sapiens"] += accession_count
-        elif accession_count:
-            organisms["Homo sapiens"] = accession_count
-
-        return organisms
+        target_organisms = union_all(
+            select(Taxonomy.organism_name.label("organism_name")).join(TargetSequence).join(published_score_sets_stmt),
+            select(literal("Homo sapiens").label("organism_name"))
+            .select_from(TargetAccession)
+            .join(published_score_sets_stmt),
+        ).subquery()
+
+        return (
+            select(target_organisms.c.organism_name, func.count(target_organisms.c.organism_name))
+            .where(target_organisms.c.organism_name.is_not(None))
+            .group_by(target_organisms.c.organism_name)
+        )
 
     # Protection from this case occurs via FastApi/pydantic Enum validation.
     else:
         raise ValueError(f"Unknown field: {field}")
 
 
-def _record_from_field_and_model(
-    db: Session,
-    model: RecordNames,
-    field: RecordFields,
-):
+# Statistics on fields relevant to both accession and sequence based targets. Generally, these require custom logic to harmonize both target sub types.
+@router.get("/target/gene/{field}", status_code=200, response_model=dict[str, int])
+def target_genes_by_field(field: TargetGeneFields, request: Request, db: Session = Depends(get_db)) -> Any:
     """
-    Given a member of the RecordNames and RecordFields Enums, generate counts that can be used to create a
-    statistic for those enums.
+    Returns a dictionary of counts for the distinct values of the provided `field` (member of the `target_sequences` table).
+    Don't include any NULL field values. Each field here is handled individually because of the unique structure of this
+    target gene object- fields might require information from both TargetGene subtypes (accession and sequence).
+    """
+    return _cached_statistic_response(
+        request, lambda: dict(db.execute(_target_gene_field_statement(field)).tuples().all())
+    )
 
-    This function should be used for generating statistics for fields shared between Experiments and Score Sets.
-    If necessary, Experiment Sets can be handled in a similar manner in the future.
+
+@lru_cache(maxsize=64)
+def _record_field_statement(model: RecordNames, field: RecordFields) -> Select:
     """
-    association_tables: dict[
-        RecordNames,
-        dict[
-            RecordFields,
-            Union[
-                Table, type[ExperimentPublicationIdentifierAssociation], type[ScoreSetPublicationIdentifierAssociation]
-            ],
-        ],
-    ] = {
-        RecordNames.experiment: {
-            RecordFields.doiIdentifiers: experiments_doi_identifiers_association_table,
-            RecordFields.publicationIdentifiers: ExperimentPublicationIdentifierAssociation,
-            RecordFields.rawReadIdentifiers: experiments_raw_read_identifiers_association_table,
-            RecordFields.keywords: experiments_keywords_association_table,
-        },
-        RecordNames.scoreSet: {
-            RecordFields.doiIdentifiers: score_sets_doi_identifiers_association_table,
-            RecordFields.publicationIdentifiers: ScoreSetPublicationIdentifierAssociation,
-            RecordFields.rawReadIdentifiers: score_sets_raw_read_identifiers_association_table,
-            RecordFields.keywords: score_sets_keywords_association_table,
-        },
-    }
-
-    models: dict[RecordNames, Union[type[Experiment], type[ScoreSet]]] = {
-        RecordNames.experiment: Experiment,
-        RecordNames.scoreSet: ScoreSet,
-    }
-
-    queried_model = models[model]
+    Build the statement counting the distinct non-NULL values of a field shared between published Experiments and
+    Score Sets.
+
+    Publication identifiers may repeat across databases, so their counts are grouped into one JSON object per database
+    name.
+    """
+
+    queried_model = RECORD_MODELS[model]
 
     # created-by field does not operate on association tables and is defined directly on score set / experiment
     # records, so we operate directly on those records.
@@ -261,62 +322,76 @@ def _record_from_field_and_model(
     model_created_by_field = getattr(queried_model, "created_by_id")
     model_published_data_field = getattr(queried_model, "published_date")
     if field is RecordFields.createdBy:
-        query = (
+        return (
             select(User.username, func.count(User.id))
             .join(queried_model, model_created_by_field == User.id)
-            .where(model_published_data_field.is_not(None))
+            .where(model_published_data_field.is_not(None), User.username.is_not(None))
             .group_by(User.id)
         )
 
-        return db.execute(query).all()
-    else:
-        # All assc table identifiers which are linked to a published model.
-        queried_assc_table = association_tables[model][field]
-        published_score_sets_statement = (
-            select(queried_assc_table).join(queried_model).where(model_published_data_field.is_not(None)).subquery()
-        )
+    # All assc table identifiers which are linked to a published model.
+    queried_assc_table = RECORD_ASSOCIATION_TABLES[model][field]
+    published_score_sets_statement = (
+        select(queried_assc_table).join(queried_model).where(model_published_data_field.is_not(None)).subquery()
+    )
 
     # Assumes any identifiers / keywords may not be duplicated within a record.
     if field is RecordFields.doiIdentifiers:
-        query = select(DoiIdentifier.identifier, func.count(DoiIdentifier.identifier)).group_by(
-            DoiIdentifier.identifier
+        query = (
+            select(DoiIdentifier.identifier, func.count(DoiIdentifier.identifier))
+            .where(DoiIdentifier.identifier.is_not(None))
+            .group_by(DoiIdentifier.identifier)
         )
     elif field is RecordFields.keywords:
-        query = select(Keyword.text, func.count(Keyword.text)).group_by(Keyword.text)
+        query = select(Keyword.text, func.count(Keyword.text)).where(Keyword.text.is_not(None)).group_by(Keyword.text)
     elif field is RecordFields.rawReadIdentifiers:
-        query = select(RawReadIdentifier.identifier, func.count(RawReadIdentifier.identifier)).group_by(
-            RawReadIdentifier.identifier
+        query = (
+            select(RawReadIdentifier.identifier, func.count(RawReadIdentifier.identifier))
+            .where(RawReadIdentifier.identifier.is_not(None))
+            .group_by(RawReadIdentifier.identifier)
         )
 
     # Handle publication identifiers separately since they may have duplicated identifiers
     elif field is RecordFields.publicationIdentifiers:
-        publication_query = (
+        publication_counts = (
             select(
                 PublicationIdentifier.identifier,
                 PublicationIdentifier.db_name,
-                func.count(PublicationIdentifier.identifier),
+                func.count(PublicationIdentifier.identifier).label("count"),
             )
             .join(published_score_sets_statement)
+            .where(PublicationIdentifier.identifier.is_not(None), PublicationIdentifier.db_name.is_not(None))
             .group_by(PublicationIdentifier.identifier, PublicationIdentifier.db_name)
+            .subquery()
         )
 
-        publication_identifiers: dict[str, dict[str, int]] = {}
-
-        for identifier, db_name, count in db.execute(publication_query).all():
-            # We don't need to worry about overwriting existing identifiers within these internal dictionaries because
-            # of the SQL group by clause.
-            if db_name in publication_identifiers:
-                publication_identifiers[db_name][identifier] = count
-            else:
-                publication_identifiers[db_name] = {identifier: count}
-
-        return [(db_name, identifiers) for db_name, identifiers in publication_identifiers.items()]
+        # We don't need to worry about overwriting existing identifiers within each database's object because of the
+        # inner group by clause.
+        return select(
+            publication_counts.c.db_name,
+            func.jsonb_object_agg(publication_counts.c.identifier, publication_counts.c.count),
+        ).group_by(publication_counts.c.db_name)
 
     # Protection from this case occurs via FastApi/pydantic Enum validation on methods which reference this one.
     else:
-        return []
+        raise ValueError(f"Unknown field: {field}")
+
+    return query.join(published_score_sets_statement)
+
+
+def _record_from_field_and_model(
+    db: Session,
+    model: RecordNames,
+    field: RecordFields,
+):
+    """
+    Given a member of the RecordNames and RecordFields Enums, generate counts that can be used to create a
+    statistic for those enums.
 
-    return db.execute(query.join(published_score_sets_statement)).all()
+    This function should be used for generating statistics for fields shared between Experiments and Score Sets.
+    If necessary, Experiment Sets can be handled in a similar manner in the future.
+    """
+    return db.execute(_record_field_statement(model, field)).all()
 
 
 # Model based statistics for shared fields.
@@ -325,14 +400,12 @@ def _record_from_field_and_model(
 #       i.e. non-shared fields, define them above this route so as not to obscure them.
 @router.get("/record/{model}/{field}", status_code=200, response_model=Union[dict[str, int], dict[str, dict[str, int]]])
 def record_object_statistics(
-    model: RecordNames, field: RecordFields, db: Session = Depends(get_db)
-) -> Union[dict[str, int], dict[str, dict[str, int]]]:
+    model: RecordNames, field: RecordFields, request: Request, db: Session = Depends(get_db)
+) -> Any:
     """
     Resolve a dictionary of statistics based on the provided model name and model field.
 
     Model names and fields should be members of the Enum classes defined above. Providing an invalid model name or
     model field will yield a 422 Unprocessable Entity error with details about valid enum values.
     """
-    count_data = _record_from_field_and_model(db, model, field)
-
-    return {field_val: count for field_val, count in count_data if field_val is not None}
+    return _cached_statistic_response(request, lambda: dict(_record_from_field_and_model(db, model, field)))
@@ -1,7 +1,7 @@
 from typing import Any, List
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func
+from sqlalchemy import func, select
 from sqlalchemy.orm import Session
 
 from mavedb import deps
@@ -33,9 +33,7 @@ def list_target_gene_names(
     List distinct target gene names, in alphabetical order.
     """
 
-    items = db.query(TargetGene).all()
-    names = map(lambda item: item.name, items)
-    return sorted(list(set(names)))
+    return db.scalars(select(TargetGene.name).distinct().order_by(TargetGene.name)).all()
 
 
 @router.get("/categories", status_code=200, response_model=List[str], responses={404: {}})
@@ -47,9 +45,7 @@ def list_target_gene_categories(
     List distinct target genes categories, in alphabetical order.
     """
 
-    items = db.query(TargetGene).all()
-    categories = map(lambda item: item.category, items)
-    return sorted(list(set(categories)))
+    return db.scalars(select(TargetGene.category).distinct().order_by(TargetGene.category)).all()
 
 
 @router.get("/{item_id}", status_code=200, response_model=target_gene.TargetGene, responses={404: {}})
@@ -1,7 +1,7 @@
 from typing import Any, List
 
 from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy import func, or_
+from sqlalchemy import func, or_, select
 from sqlalchemy.orm import Session
 
 from mavedb import deps
@@ -34,9 +34,12 @@ def list_taxonomy_organism_names(
     List distinct species names, in alphabetical order.
     """
 
-    items = db.query(Taxonomy).all()
-    organism_names = map(lambda item: item.organism_name, items)
-    return sorted(list(set(organism_names)))
+    return db.scalars(
+        select(Taxonomy.organism_name)
+        .where(Taxonomy.organism_name.is_not(None))
+        .distinct()
+        .order_by(Taxonomy.organism_name)
+    ).all()
 
 @router.get("/commonNames", status_code=200, response_model=List[str], responses={404: {}})
 def list_taxonomy_common_names(
@@ -47,9 +50,12 @@ def list_taxonomy_common_names(
     List distinct common names, in alphabetical order.
     """
 
-    items = db.query(Taxonomy).all()
-    common_names = map(lambda item: item.common_name, items)
-    return sorted(list(set(common_names)))
+    return db.scalars(
+        select(Taxonomy.common_name)
+        .where(Taxonomy.common_name.is_not(None))
+        .distinct()
+        .order_by(Taxonomy.common_name)
+    ).all()
 
 @router.get('/{item_id}', status_code=200, response_model=taxonomy.Taxonomy, responses={404: {}})
 def fetch_taxonomy(
@@ -6,6 +6,7 @@ from fastapi.encoders import jsonable_encoder
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
+from fastapi.responses import ORJSONResponse
 from requests import Request
 from sqlalchemy.orm import configure_mappers
 from starlette import status
@@ -48,7 +49,7 @@ logger = logging.getLogger(__name__)
 # an instance of the related class has been created.
 configure_mappers()
 
-app = FastAPI()
+app = FastAPI(default_response_class=ORJSONResponse)
 app.add_middleware(
     CORSMiddleware,
     allow_origins=["*"],
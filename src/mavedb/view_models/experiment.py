@@ -127,8 +127,6 @@ class ShortExperiment(SavedExperiment):
 
 # Properties to return to admin clients
 class AdminExperiment(Experiment):
-    score_set_urns: list[str]
-    processing_state: Optional[str]
     approved: bool
 
 
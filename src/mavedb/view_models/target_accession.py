@@ -11,7 +11,7 @@ class TargetAccessionBase(BaseModel):
 
     @validator("gene", always=True)
     def check_gene_or_assembly(cls, gene, values):
-        if "assembly" not in values and not gene:
+        if not values.get("assembly") and not gene:
             raise ValueError("either a `gene` or `assembly` is required")
         return gene
 
@@ -2,7 +2,7 @@ import logging
 
 import pandas as pd
 from cdot.hgvs.dataproviders import RESTDataProvider
-from sqlalchemy import delete, select, null
+from sqlalchemy import delete, exists, select, null
 from sqlalchemy.orm import Session
 
 from mavedb.lib.score_sets import (
@@ -50,7 +50,7 @@ async def create_variants_for_score_set(
         if not score_set.target_genes:
             raise ValueError("Can't create variants when score set has no targets.")
 
-        if score_set.variants:
+        if db.scalar(select(exists().where(Variant.score_set_id == score_set.id))):
             db.execute(delete(Variant).where(Variant.score_set_id == score_set.id))
 
             db.commit()
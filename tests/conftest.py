@@ -16,7 +16,7 @@ from fakeredis.aioredis import FakeConnection
 from fastapi.testclient import TestClient
 from httpx import AsyncClient
 from redis.asyncio.connection import ConnectionPool
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, text
 from sqlalchemy.orm import sessionmaker
 from sqlalchemy.pool import NullPool
 
@@ -24,6 +24,7 @@ from mavedb.db.base import Base
 from mavedb.deps import get_db, get_worker, hgvs_data_provider
 from mavedb.lib.authorization import require_current_user
 from mavedb.lib.authentication import get_current_user, UserData
+from mavedb.lib.caching import clear_caches
 from mavedb.models.user import User
 from mavedb.server_main import app
 from mavedb.worker.jobs import create_variants_for_score_set
@@ -49,14 +50,28 @@ def session(postgresql):
     engine = create_engine(connection, echo=False, poolclass=NullPool)
     session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+    # Trigram indices on identifier columns depend on this extension.
+    with engine.begin() as conn:
+        conn.execute(text("CREATE EXTENSION IF NOT EXISTS pg_trgm"))
     Base.metadata.create_all(bind=engine)
 
+    db = session()
     try:
-        yield session()
+        yield db
     finally:
+        # Tests that read through the session leave its transaction open, which would block dropping the tables.
+        db.close()
         Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def clear_response_caches():
+    """
+    In-process response caches outlive the database they were filled from, so start each test with them empty.
+    """
+    clear_caches()
+
+
 @pytest.fixture
 def data_provider():
     """
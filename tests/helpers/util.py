@@ -1,10 +1,11 @@
+from contextlib import contextmanager
 from copy import deepcopy
 from unittest.mock import patch
 
 import cdot.hgvs.dataproviders
 import jsonschema
 from arq import ArqRedis
-from sqlalchemy import select
+from sqlalchemy import event, select
 
 from mavedb.models.user import User
 from mavedb.models.score_set import ScoreSet as ScoreSetDbModel
@@ -22,6 +23,22 @@ from tests.helpers.constants import (
 )
 
 
+@contextmanager
+def count_queries(db):
+    """Collect the SQL statements executed through the given session's engine while the context is open."""
+    statements = []
+
+    def record_statement(conn, cursor, statement, parameters, context, executemany):
+        statements.append(statement)
+
+    engine = db.get_bind()
+    event.listen(engine, "before_cursor_execute", record_statement)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", record_statement)
+
+
 def change_ownership(db, urn, model):
     """Change the ownership of the record with given urn and model to the extra user."""
     item = db.query(model).filter(model.urn == urn).one_or_none()
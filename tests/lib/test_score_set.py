@@ -13,6 +13,9 @@ from mavedb.lib.score_sets import (
     create_variants,
     create_variants_data,
     csv_data_to_df,
+    get_score_set_counts_as_csv,
+    get_score_set_scores_as_csv,
+    variants_to_csv_df,
 )
 from mavedb.lib.validation.constants.general import (
     hgvs_nt_column,
@@ -308,3 +311,67 @@ def test_create_variants_acc_score_set(setup_lib_db, client, session):
         assert db_variant.urn.split("#")[0] == score_set.urn
 
     session.commit()
+
+
+def test_get_score_set_scores_as_csv(setup_lib_db, client, session):
+    experiment = create_experiment(client)
+    create_seq_score_set(client, experiment["urn"])
+    score_set = session.scalars(select(ScoreSet)).first()
+    score_set.dataset_columns = {"score_columns": ["score", "sd"], "count_columns": []}
+    variant_data = [
+        {"score_data": {"score": 1.5, "sd": 2}},
+        {"score_data": {"score": None, "sd": " NA "}},
+        {"score_data": {"score": -0.25}},
+        {"score_data": {}},
+    ]
+    session.add_all(
+        Variant(
+            urn=f"{score_set.urn}#{i + 1}",
+            score_set=score_set,
+            hgvs_nt=f"c.{i + 1}A>G" if i % 2 == 0 else None,
+            hgvs_pro="p.=" if i == 1 else None,
+            data=data,
+        )
+        for i, data in enumerate(variant_data)
+    )
+    session.commit()
+
+    assert get_score_set_scores_as_csv(session, score_set) == (
+        "accession,hgvs_nt,hgvs_splice,hgvs_pro,score,sd\r\n"
+        f"{score_set.urn}#1,c.1A>G,NA,NA,1.5,2\r\n"
+        f"{score_set.urn}#2,NA,NA,p.=,NA,NA\r\n"
+        f"{score_set.urn}#3,c.3A>G,NA,NA,-0.25,NA\r\n"
+        f"{score_set.urn}#4,NA,NA,NA,NA,NA\r\n"
+    )
+    assert get_score_set_scores_as_csv(session, score_set, start=1, limit=2) == (
+        "accession,hgvs_nt,hgvs_splice,hgvs_pro,score,sd\r\n"
+        f"{score_set.urn}#2,NA,NA,p.=,NA,NA\r\n"
+        f"{score_set.urn}#3,c.3A>G,NA,NA,-0.25,NA\r\n"
+    )
+    assert get_score_set_counts_as_csv(session, score_set, limit=1) == (
+        f"accession,hgvs_nt,hgvs_splice,hgvs_pro\r\n{score_set.urn}#1,c.1A>G,NA,NA\r\n"
+    )
+    session.rollback()
+
+
+def test_variants_to_csv_df_with_missing_values():
+    variants = [
+        Variant(urn="tmp:1#1", hgvs_nt="c.1A>G", data={"score_data": {"score": 1.5, "sd": " null "}}),
+        Variant(urn="tmp:1#2", hgvs_pro="p.=", data={"score_data": {"score": None}}),
+    ]
+
+    df = variants_to_csv_df(
+        variants, columns=["hgvs_nt", "hgvs_splice", "hgvs_pro", "score", "sd"], dtype="score_data", na_rep=pd.NA
+    )
+
+    expected = pd.DataFrame(
+        {
+            "hgvs_nt": ["c.1A>G", pd.NA],
+            "hgvs_splice": [pd.NA, pd.NA],
+            "hgvs_pro": [pd.NA, "p.="],
+            "score": ["1.5", pd.NA],
+            "sd": [pd.NA, pd.NA],
+        },
+        dtype=object,
+    )
+    pd.testing.assert_frame_equal(df, expected)
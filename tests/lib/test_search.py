@@ -0,0 +1,13 @@
+from mavedb.lib.search import contains_pattern
+
+
+def test_contains_pattern_wraps_text_in_wildcards():
+    assert contains_pattern("abc") == "%abc%"
+
+
+def test_contains_pattern_escapes_like_wildcards():
+    assert contains_pattern("10.1000/a_b%c") == "%10.1000/a\\_b\\%c%"
+
+
+def test_contains_pattern_escapes_backslashes():
+    assert contains_pattern("a\\b") == "%a\\\\b%"
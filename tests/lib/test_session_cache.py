@@ -0,0 +1,22 @@
+import pytest
+
+from mavedb.lib.taxonomies import find_or_create_taxonomy
+from mavedb.view_models.taxonomy import TaxonomyCreate
+
+from tests.helpers.constants import TEST_TAXONOMY
+from tests.helpers.util import count_queries
+
+
+@pytest.mark.asyncio
+async def test_find_or_create_taxonomy_is_cached_for_transaction(setup_lib_db, session):
+    taxonomy_create = TaxonomyCreate(tax_id=TEST_TAXONOMY["tax_id"])
+
+    taxonomy = await find_or_create_taxonomy(session, taxonomy_create)
+    with count_queries(session) as queries:
+        assert await find_or_create_taxonomy(session, taxonomy_create) is taxonomy
+    assert queries == []
+
+    session.rollback()
+    with count_queries(session) as queries:
+        assert (await find_or_create_taxonomy(session, taxonomy_create)).id == taxonomy.id
+    assert len(queries) == 1
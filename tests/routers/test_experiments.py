@@ -6,14 +6,23 @@ import jsonschema
 import pytest
 import requests
 import requests_mock
+from sqlalchemy import select
 
+from mavedb.lib.authentication import get_current_user
 from mavedb.lib.validation.urn_re import MAVEDB_TMP_URN_RE
-from mavedb.models.experiment import Experiment as ExperimentDbModel
+from mavedb.models.doi_identifier import DoiIdentifier
+from mavedb.models.experiment import (
+    Experiment as ExperimentDbModel,
+    experiments_doi_identifiers_association_table,
+    experiments_keywords_association_table,
+)
 from mavedb.models.experiment_set import ExperimentSet as ExperimentSetDbModel
+from mavedb.models.keyword import Keyword
 from mavedb.models.score_set import ScoreSet as ScoreSetDbModel
 from mavedb.view_models.experiment import Experiment, ExperimentCreate
 from tests.helpers.util import (
     change_ownership,
+    count_queries,
     create_experiment,
     create_seq_score_set,
     create_seq_score_set_with_variants,
@@ -26,6 +35,7 @@ from tests.helpers.constants import (
     TEST_MINIMAL_EXPERIMENT,
     TEST_MINIMAL_EXPERIMENT_RESPONSE,
     TEST_PUBMED_IDENTIFIER,
+    TEST_USER,
 )
 from tests.helpers.dependency_overrider import DependencyOverrider
 
@@ -64,6 +74,19 @@ def test_can_delete_experiment(client, setup_router_db):
     assert get_response.status_code == 404
 
 
+def test_deleting_experiment_removes_its_keyword_and_doi_associations(session, client, setup_router_db):
+    experiment = create_experiment(
+        client, {"keywords": ["alpha"], "doiIdentifiers": [{"identifier": "10.1000/xyz123"}]}
+    )
+    response = client.delete(f"api/v1/experiments/{experiment['urn']}")
+    assert response.status_code == 200
+
+    assert session.execute(select(experiments_keywords_association_table)).all() == []
+    assert session.execute(select(experiments_doi_identifiers_association_table)).all() == []
+    assert [keyword.text for keyword in session.query(Keyword)] == ["alpha"]
+    assert session.query(DoiIdentifier).count() == 1
+
+
 @pytest.mark.parametrize(
     "test_field,test_value",
     [
@@ -339,7 +362,7 @@ def test_required_fields(client, setup_router_db, test_field):
 
 @pytest.mark.parametrize(
     "mock_publication_fetch",
-    [({"dbName": "PubMed", "identifier": f"{TEST_PUBMED_IDENTIFIER}"})],
+    [{"dbName": "PubMed", "identifier": f"{TEST_PUBMED_IDENTIFIER}"}],
     indirect=["mock_publication_fetch"],
 )
 def test_create_experiment_with_new_primary_pubmed_publication(client, setup_router_db, mock_publication_fetch):
@@ -527,6 +550,28 @@ def test_create_experiment_with_invalid_doi(client, setup_router_db):
     )
 
 
+def test_create_experiments_with_shared_doi(session, client, setup_router_db):
+    experiment_post_payload = deepcopy(TEST_MINIMAL_EXPERIMENT)
+    experiment_post_payload.update(
+        {"doiIdentifiers": [{"identifier": "10.1000/xyz123"}, {"identifier": "10.1000/xyz123"}]}
+    )
+    experiment_1 = client.post("/api/v1/experiments/", json=experiment_post_payload).json()
+    experiment_2 = client.post("/api/v1/experiments/", json=experiment_post_payload).json()
+
+    assert [doi["identifier"] for doi in experiment_1["doiIdentifiers"]] == ["10.1000/xyz123"]
+    assert experiment_1["doiIdentifiers"] == experiment_2["doiIdentifiers"]
+    assert session.query(DoiIdentifier).count() == 1
+
+
+def test_create_experiments_with_shared_keywords(session, client, setup_router_db):
+    experiment_1 = create_experiment(client, {"keywords": ["alpha", "beta", "alpha"]})
+    experiment_2 = create_experiment(client, {"keywords": ["gamma", "beta"]})
+
+    assert sorted(experiment_1["keywords"]) == ["alpha", "beta"]
+    assert sorted(experiment_2["keywords"]) == ["beta", "gamma"]
+    assert sorted(keyword.text for keyword in session.query(Keyword)) == ["alpha", "beta", "gamma"]
+
+
 def test_create_experiment_with_invalid_primary_publication(client, setup_router_db):
     experiment_post_payload = deepcopy(TEST_MINIMAL_EXPERIMENT)
     experiment_post_payload.update({"primaryPublicationIdentifiers": [{"identifier": "abcdefg"}]})
@@ -587,6 +632,89 @@ def test_admin_can_get_other_users_private_experiment(client, admin_app_override
         assert (key, expected_response[key]) == (key, response_data[key])
 
 
+def test_list_experiments_query_count_does_not_depend_on_experiment_count(session, client, setup_router_db):
+    experiment = create_experiment(client)
+    create_seq_score_set(client, experiment["urn"])
+    with count_queries(session) as single_experiment_queries:
+        response = client.get("/api/v1/experiments/")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+    for _ in range(2):
+        experiment = create_experiment(client)
+        create_seq_score_set(client, experiment["urn"])
+    with count_queries(session) as queries:
+        response = client.get("/api/v1/experiments/")
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert len(queries) == len(single_experiment_queries)
+
+
+def test_search_experiments_query_count_does_not_depend_on_experiment_count(session, client, setup_router_db):
+    experiment = create_experiment(client)
+    create_seq_score_set(client, experiment["urn"])
+    with count_queries(session) as single_experiment_queries:
+        response = client.post("/api/v1/me/experiments/search", json={})
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+    for _ in range(2):
+        experiment = create_experiment(client)
+        create_seq_score_set(client, experiment["urn"])
+    with count_queries(session) as queries:
+        response = client.post("/api/v1/me/experiments/search", json={})
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert len(queries) == len(single_experiment_queries)
+
+
+def test_get_experiment_score_sets_query_count_does_not_depend_on_score_set_count(session, client, setup_router_db):
+    experiment = create_experiment(client)
+    create_seq_score_set(client, experiment["urn"])
+    with count_queries(session) as single_score_set_queries:
+        response = client.get(f"/api/v1/experiments/{experiment['urn']}/score-sets")
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+    for _ in range(2):
+        create_seq_score_set(client, experiment["urn"])
+    with count_queries(session) as queries:
+        response = client.get(f"/api/v1/experiments/{experiment['urn']}/score-sets")
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert len(queries) == len(single_score_set_queries)
+
+
+def test_list_experiments_cache_is_cleared_when_experiments_change(session, client, setup_router_db):
+    experiment = create_experiment(client)
+    response = client.get("/api/v1/experiments/")
+    assert response.status_code == 200
+    assert client.get("/api/v1/experiments/").json() == response.json()
+
+    client.put(f"/api/v1/experiments/{experiment['urn']}", json={**TEST_MINIMAL_EXPERIMENT, "title": "Updated Title"})
+    create_experiment(client)
+    response = client.get("/api/v1/experiments/")
+    assert response.status_code == 200
+    assert sorted(item["title"] for item in response.json()) == ["Test Experiment Title", "Updated Title"]
+
+
+
+@pytest.mark.asyncio
+async def test_list_experiments_cache_survives_login(session, client, setup_router_db):
+    create_experiment(client)
+    response = client.get("/api/v1/experiments/")
+    assert response.status_code == 200
+
+    # Authenticating with a token records the user's last login.
+    user_data = await get_current_user(None, {"sub": TEST_USER["username"]}, session, None)
+    assert user_data.user.last_login is not None
+
+    with count_queries(session) as queries:
+        cached_response = client.get("/api/v1/experiments/")
+    assert cached_response.json() == response.json()
+    assert not any("FROM experiments" in query for query in queries)
+
+
 def test_search_experiments(session, client, setup_router_db):
     experiment = create_experiment(client)
     search_payload = {"text": experiment["shortDescription"]}
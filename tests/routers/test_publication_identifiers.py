@@ -0,0 +1,149 @@
+from mavedb.models.keyword import Keyword
+from mavedb.models.publication_identifier import PublicationIdentifier
+
+from tests.helpers.util import count_queries
+
+
+def add_publications(session):
+    session.add_all(
+        [
+            PublicationIdentifier(
+                identifier="1", db_name="PubMed", title="First", authors=[], publication_journal="Journal B"
+            ),
+            PublicationIdentifier(
+                identifier="2",
+                db_name="PubMed",
+                title="Second",
+                authors=[],
+                publication_journal="Journal A",
+                doi="10.1000/ABC.2",
+            ),
+            PublicationIdentifier(identifier="3", db_name="bioRxiv", title="Third", authors=[]),
+            PublicationIdentifier(
+                identifier="1", db_name="Crossref", title="Fourth", authors=[], publication_journal="Journal B"
+            ),
+        ]
+    )
+    session.commit()
+
+
+def test_list_publication_journal_names(session, client, setup_router_db):
+    add_publications(session)
+    response = client.get("/api/v1/publication-identifiers/journals")
+    assert response.status_code == 200
+    assert response.json() == ["Journal A", "Journal B"]
+
+
+def test_list_publication_database_names(session, client, setup_router_db):
+    add_publications(session)
+    response = client.get("/api/v1/publication-identifiers/databases")
+    assert response.status_code == 200
+    assert sorted(response.json()) == ["Crossref", "PubMed", "bioRxiv"]
+
+
+def test_fetch_publication_by_db_name_and_identifier(session, client, setup_router_db):
+    add_publications(session)
+    response = client.get("/api/v1/publication-identifiers/Crossref/1")
+    assert response.status_code == 200
+    assert response.json()["dbName"] == "Crossref"
+    assert response.json()["title"] == "Fourth"
+
+
+def test_search_publications_by_doi_ignores_case(session, client, setup_router_db):
+    add_publications(session)
+    response = client.post("/api/v1/publication-identifiers/search/doi", json={"text": "abc.2"})
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()] == ["Second"]
+
+
+def test_search_publications_matches_identifier_or_doi(session, client, setup_router_db):
+    add_publications(session)
+    response = client.post("/api/v1/publication-identifiers/search", json={"text": "2"})
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()] == ["Second"]
+    response = client.post("/api/v1/publication-identifiers/search", json={"text": "ABC"})
+    assert response.status_code == 200
+    assert [item["title"] for item in response.json()] == ["Second"]
+
+
+def test_list_publication_journal_names_not_modified(session, client, setup_router_db):
+    add_publications(session)
+    response = client.get("/api/v1/publication-identifiers/journals")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/v1/publication-identifiers/journals", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+def test_list_publication_database_names_changes_etag_when_publications_change(session, client, setup_router_db):
+    add_publications(session)
+    response = client.get("/api/v1/publication-identifiers/databases")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    session.add(PublicationIdentifier(identifier="5", db_name="medRxiv", title="Fifth", authors=[]))
+    session.commit()
+
+    response = client.get("/api/v1/publication-identifiers/databases", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert sorted(response.json()) == ["Crossref", "PubMed", "bioRxiv", "medRxiv"]
+
+
+def test_list_publication_journal_names_cache_survives_unrelated_writes(session, client, setup_router_db):
+    add_publications(session)
+    response = client.get("/api/v1/publication-identifiers/journals")
+    assert response.status_code == 200
+
+    session.add(Keyword(text="Unrelated keyword"))
+    session.commit()
+
+    with count_queries(session) as queries:
+        cached_response = client.get("/api/v1/publication-identifiers/journals")
+    assert cached_response.json() == response.json()
+    assert not any("publication_identifiers" in query for query in queries)
+
+
+def test_search_publications_by_identifier(session, client, setup_router_db):
+    add_publications(session)
+    response = client.post("/api/v1/publication-identifiers/search/identifier", json={"text": "1"})
+    assert response.status_code == 200
+    assert sorted(item["title"] for item in response.json()) == ["First", "Fourth"]
+
+
+def test_search_publications_requires_text(session, client, setup_router_db):
+    response = client.post("/api/v1/publication-identifiers/search", json={"text": "  "})
+    assert response.status_code == 500
+    assert response.json()["detail"] == "Search text is required"
+
+
+def test_list_publications(session, client, setup_router_db):
+    add_publications(session)
+    response = client.get("/api/v1/publication-identifiers/")
+    assert response.status_code == 200
+    assert response.headers["content-type"] == "application/json"
+    publications = sorted(response.json(), key=lambda item: item["title"])
+    assert [item["title"] for item in publications] == ["First", "Fourth", "Second", "Third"]
+    assert publications[2]["dbName"] == "PubMed"
+    assert publications[2]["publicationJournal"] == "Journal A"
+    assert publications[2]["doi"] == "10.1000/ABC.2"
+    assert publications[2]["authors"] == []
+
+
+def test_list_publications_when_there_are_none(client, setup_router_db):
+    response = client.get("/api/v1/publication-identifiers/")
+    assert response.status_code == 200
+    assert response.json() == []
+
+
+def test_search_publications_treats_like_wildcards_literally(session, client, setup_router_db):
+    add_publications(session)
+    response = client.post("/api/v1/publication-identifiers/search/doi", json={"text": "ABC_2"})
+    assert response.status_code == 200
+    assert response.json() == []
+    response = client.post("/api/v1/publication-identifiers/search/identifier", json={"text": "%"})
+    assert response.status_code == 200
+    assert response.json() == []
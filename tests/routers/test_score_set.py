@@ -8,7 +8,10 @@ import pytest
 from arq import ArqRedis
 from mavedb.lib.validation.urn_re import MAVEDB_TMP_URN_RE
 from mavedb.models.enums.processing_state import ProcessingState
+from mavedb.models.keyword import Keyword
+from mavedb.models.publication_identifier import PublicationIdentifier
 from mavedb.models.score_set import ScoreSet as ScoreSetDbModel
+from mavedb.models.score_set_publication_identifier import ScoreSetPublicationIdentifierAssociation
 from mavedb.view_models.score_set import ScoreSet, ScoreSetCreate
 
 from tests.helpers.constants import (
@@ -18,6 +21,7 @@ from tests.helpers.constants import (
 )
 from tests.helpers.util import (
     change_ownership,
+    count_queries,
     create_experiment,
     create_seq_score_set,
     create_seq_score_set_with_variants,
@@ -58,6 +62,17 @@ def test_create_minimal_score_set(client, setup_router_db):
     assert response.status_code == 200
 
 
+def test_create_score_sets_with_shared_keywords(session, client, setup_router_db):
+    experiment = create_experiment(client, {"keywords": ["alpha"]})
+    score_set_1 = create_seq_score_set(client, experiment["urn"], {"keywords": ["alpha", "beta", "alpha"]})
+    score_set_2 = create_seq_score_set(client, experiment["urn"], {"keywords": ["gamma", "beta"]})
+
+    assert sorted(score_set_1["keywords"]) == ["alpha", "beta"]
+    assert sorted(score_set_2["keywords"]) == ["beta", "gamma"]
+    assert sorted(keyword.text for keyword in session.query(Keyword)) == ["alpha", "beta", "gamma"]
+    session.rollback()
+
+
 def test_cannot_create_score_set_without_email(client, setup_router_db):
     experiment = create_experiment(client)
     score_set_post_payload = deepcopy(TEST_MINIMAL_SEQ_SCORESET)
@@ -337,6 +352,51 @@ def test_publish_score_set(session, data_provider, client, setup_router_db, data
         assert (key, expected_response[key]) == (key, score_set[key])
 
 
+def test_score_set_csvs_are_unavailable_while_new_variants_are_processed(
+    session, data_provider, client, setup_router_db, data_files
+):
+    experiment = create_experiment(client)
+    score_set = create_seq_score_set_with_variants(
+        client, session, data_provider, experiment["urn"], data_files / "scores.csv"
+    )
+
+    scores_csv_path = data_files / "scores.csv"
+    with (
+        open(scores_csv_path, "rb") as scores_file,
+        patch.object(ArqRedis, "enqueue_job", return_value=None) as queue,
+    ):
+        response = client.post(
+            f"/api/v1/score-sets/{score_set['urn']}/variants/data",
+            files={"scores_file": (scores_csv_path.name, scores_file, "text/csv")},
+        )
+        queue.assert_called_once()
+    assert response.status_code == 200
+
+    # The worker has not yet replaced the previous upload's variants.
+    for dataset in ("scores", "counts"):
+        response = client.get(f"/api/v1/score-sets/{score_set['urn']}/{dataset}")
+        assert response.status_code == 409
+        assert response.json()["detail"] == f"variants for score set with URN '{score_set['urn']}' are being processed"
+
+
+def test_get_score_set_scores_csv(session, data_provider, client, setup_router_db, data_files):
+    experiment = create_experiment(client)
+    score_set = create_seq_score_set_with_variants(
+        client, session, data_provider, experiment["urn"], data_files / "scores.csv"
+    )
+
+    response = client.get(f"/api/v1/score-sets/{score_set['urn']}/scores")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/csv")
+    lines = response.text.splitlines()
+    assert lines[0] == "accession,hgvs_nt,hgvs_splice,hgvs_pro,score"
+    assert lines[1:] == [
+        f"{score_set['urn']}#1,c.1A>T,NA,p.Thr1Ser,0.3",
+        f"{score_set['urn']}#2,c.2C>T,NA,p.Thr1Met,0.0",
+        f"{score_set['urn']}#3,c.6T>A,NA,p.Phe2Leu,-1.65",
+    ]
+
+
 def test_publish_multiple_score_sets(session, data_provider, client, setup_router_db, data_files):
     experiment = create_experiment(client)
     score_set_1 = create_seq_score_set_with_variants(
@@ -681,6 +741,55 @@ def test_search_score_sets_match(session, data_provider, client, setup_router_db
     assert response.json()[0]["title"] == score_set_1_1["title"]
 
 
+def test_search_score_sets_query_count_does_not_depend_on_score_set_count(session, client, setup_router_db):
+    experiment = create_experiment(client)
+    create_seq_score_set(client, experiment["urn"])
+    with count_queries(session) as single_score_set_queries:
+        response = client.post("/api/v1/me/score-sets/search", json={})
+    assert response.status_code == 200
+    assert len(response.json()) == 1
+
+    for _ in range(2):
+        experiment = create_experiment(client)
+        create_seq_score_set(client, experiment["urn"])
+    with count_queries(session) as queries:
+        response = client.post("/api/v1/me/score-sets/search", json={})
+    assert response.status_code == 200
+    assert len(response.json()) == 3
+    assert len(queries) == len(single_score_set_queries)
+
+
+def test_get_score_set_query_count_does_not_depend_on_publication_count(session, client, setup_router_db):
+    experiment = create_experiment(client)
+    score_set = create_seq_score_set(client, experiment["urn"])
+    score_set_id = session.query(ScoreSetDbModel.id).filter(ScoreSetDbModel.urn == score_set["urn"]).scalar()
+
+    def add_publication(identifier):
+        publication = PublicationIdentifier(identifier=identifier, db_name="PubMed", title=identifier, authors=[])
+        session.add(publication)
+        session.flush()
+        session.add(
+            ScoreSetPublicationIdentifierAssociation(
+                score_set_id=score_set_id, publication_identifier_id=publication.id, primary=False
+            )
+        )
+        session.commit()
+
+    add_publication("1")
+    with count_queries(session) as single_publication_queries:
+        response = client.get(f"/api/v1/score-sets/{score_set['urn']}")
+    assert response.status_code == 200
+    assert len(response.json()["secondaryPublicationIdentifiers"]) == 1
+
+    add_publication("2")
+    add_publication("3")
+    with count_queries(session) as queries:
+        response = client.get(f"/api/v1/score-sets/{score_set['urn']}")
+    assert response.status_code == 200
+    assert len(response.json()["secondaryPublicationIdentifiers"]) == 3
+    assert len(queries) == len(single_publication_queries)
+
+
 def test_anonymous_cannot_delete_other_users_private_scoreset(
     session, data_provider, client, setup_router_db, data_files, anonymous_app_overrides
 ):
@@ -1,8 +1,15 @@
+from datetime import datetime
 from unittest.mock import patch
 
 import cdot.hgvs.dataproviders
 import pytest
 from humps import camelize
+from sqlalchemy import select
+
+from mavedb.models.score_set import ScoreSet
+from mavedb.models.target_accession import TargetAccession
+from mavedb.models.target_gene import TargetGene
+from mavedb.models.user import User
 
 from tests.helpers.constants import (
     TEST_BIORXIV_IDENTIFIER,
@@ -13,6 +20,7 @@ from tests.helpers.constants import (
     TEST_PUBMED_IDENTIFIER,
 )
 from tests.helpers.util import (
+    count_queries,
     create_acc_score_set_with_variants,
     create_experiment,
     create_seq_score_set_with_variants,
@@ -84,6 +92,74 @@ def test_empty_database_statistics(client):
         assert response.json() == {}, f"Non-empty response for endpoint {endpoint}."
 
 
+def test_statistics_not_modified(client):
+    response = client.get("/api/v1/statistics/target/gene/category")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    response = client.get("/api/v1/statistics/target/gene/category", headers={"If-None-Match": etag})
+    assert response.status_code == 304
+    assert response.headers["ETag"] == etag
+    assert response.content == b""
+
+
+def test_statistics_are_cached_until_records_change(session, client, setup_seq_scoreset):
+    response = client.get("/api/v1/statistics/target/gene/organism")
+    assert response.status_code == 200
+
+    with count_queries(session) as queries:
+        cached_response = client.get("/api/v1/statistics/target/gene/organism")
+    assert cached_response.json() == response.json()
+    assert not any("target_genes" in query for query in queries)
+
+    score_set = session.scalars(select(ScoreSet)).one()
+    session.add(
+        TargetGene(
+            name="Accession target",
+            category="Protein coding",
+            score_set_id=score_set.id,
+            target_accession=TargetAccession(accession="NM_001637.3"),
+        )
+    )
+    session.commit()
+
+    response = client.get("/api/v1/statistics/target/gene/organism")
+    assert response.json()["Homo sapiens"] == 1
+
+
+def test_statistics_cache_survives_unrelated_writes(session, client, setup_seq_scoreset):
+    response = client.get("/api/v1/statistics/target/gene/organism")
+    assert response.status_code == 200
+
+    user = session.scalars(select(User)).first()
+    user.last_login = datetime.now()
+    session.commit()
+
+    with count_queries(session) as queries:
+        cached_response = client.get("/api/v1/statistics/target/gene/organism")
+    assert cached_response.json() == response.json()
+    assert not any("target_genes" in query for query in queries)
+
+
+def test_statistics_etag_changes_when_score_set_is_published(
+    session, data_provider, client, setup_router_db, data_files
+):
+    response = client.get("/api/v1/statistics/target/sequence/sequence-type")
+    assert response.status_code == 200
+    etag = response.headers["ETag"]
+
+    experiment = create_experiment(client)
+    score_set = create_seq_score_set_with_variants(
+        client, session, data_provider, experiment["urn"], data_files / "scores.csv"
+    )
+    publish_score_set(client, score_set["urn"])
+
+    response = client.get("/api/v1/statistics/target/sequence/sequence-type", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    assert response.headers["ETag"] != etag
+    assert_statistic(TEST_MINIMAL_SEQ_SCORESET["targetGenes"][0]["targetSequence"]["sequenceType"], response)
+
+
 # Test target accession statistics
 @pytest.mark.parametrize(
     "field_value",
@@ -97,6 +173,24 @@ def test_target_accession_statistics(client, field_value, setup_acc_scoreset):
     assert_statistic(desired_field_value, response)
 
 
+def test_target_accession_statistics_exclude_null_values(session, client, setup_seq_scoreset):
+    """Test target accession statistics endpoint omits targets of published score sets that lack the field."""
+    score_set = session.scalars(select(ScoreSet)).one()
+    session.add(
+        TargetGene(
+            name="Accession target",
+            category="Protein coding",
+            score_set_id=score_set.id,
+            target_accession=TargetAccession(accession="NM_001637.3"),
+        )
+    )
+    session.commit()
+
+    response = client.get("/api/v1/statistics/target/accession/gene")
+    assert response.status_code == 200
+    assert response.json() == {}
+
+
 def test_target_accession_invalid_field(client):
     """Test target accession statistic response for an invalid target accession field."""
     response = client.get("/api/v1/statistics/target/accession/invalid-field")
@@ -171,6 +265,27 @@ def test_target_gene_field_statistics_seq(client, field, desired_field_value, se
     assert_statistic(desired_field_value, response)
 
 
+def test_target_gene_organism_statistics_combine_target_types(session, client, setup_seq_scoreset):
+    """Test target gene organism endpoint counts both accession and sequence based targets of published score sets."""
+    score_set = session.scalars(select(ScoreSet)).one()
+    session.add(
+        TargetGene(
+            name="Accession target",
+            category="Protein coding",
+            score_set_id=score_set.id,
+            target_accession=TargetAccession(accession="NM_001637.3"),
+        )
+    )
+    session.commit()
+
+    response = client.get("/api/v1/statistics/target/gene/organism")
+    assert response.status_code == 200
+    assert response.json() == {
+        TEST_MINIMAL_SEQ_SCORESET["targetGenes"][0]["targetSequence"]["taxonomy"]["organismName"]: 1,
+        "Homo sapiens": 1,
+    }
+
+
 # Target gene identifier based statistics behave similarly enough to parametrize.
 @pytest.mark.parametrize("field_value", TARGET_GENE_IDENTIFIER_FIELDS)
 @pytest.mark.parametrize(
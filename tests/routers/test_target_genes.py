@@ -0,0 +1,15 @@
+from tests.helpers.util import create_experiment, create_seq_score_set
+
+
+def test_list_target_gene_names_and_categories_are_distinct(client, setup_router_db):
+    experiment = create_experiment(client)
+    create_seq_score_set(client, experiment["urn"])
+    create_seq_score_set(client, experiment["urn"])
+
+    response = client.get("/api/v1/target-genes/names")
+    assert response.status_code == 200
+    assert response.json() == ["TEST1"]
+
+    response = client.get("/api/v1/target-genes/categories")
+    assert response.status_code == 200
+    assert response.json() == ["Protein coding"]
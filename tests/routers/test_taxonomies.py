@@ -0,0 +1,16 @@
+from mavedb.models.taxonomy import Taxonomy
+
+from tests.helpers.constants import TEST_TAXONOMY
+
+
+def test_list_taxonomy_names_skip_missing_values(session, client, setup_router_db):
+    session.add(Taxonomy(id=2, tax_id=10090, organism_name=None, common_name=None, url=""))
+    session.commit()
+
+    response = client.get("/api/v1/taxonomies/speciesNames")
+    assert response.status_code == 200
+    assert response.json() == [TEST_TAXONOMY["organism_name"]]
+
+    response = client.get("/api/v1/taxonomies/commonNames")
+    assert response.status_code == 200
+    assert response.json() == [TEST_TAXONOMY["common_name"]]
@@ -0,0 +1,22 @@
+from mavedb.view_models.target_accession import TargetAccessionCreate
+
+import pytest
+
+
+def test_create_target_accession_with_gene_only():
+    target_accession = TargetAccessionCreate(accession="NM_001637.3", gene="BRCA1")
+    assert target_accession.gene == "BRCA1"
+    assert target_accession.assembly is None
+
+
+def test_create_target_accession_with_assembly_only():
+    target_accession = TargetAccessionCreate(accession="NM_001637.3", assembly="GRCh37")
+    assert target_accession.assembly == "GRCh37"
+    assert target_accession.gene is None
+
+
+def test_cannot_create_target_accession_without_gene_or_assembly():
+    with pytest.raises(ValueError) as exc_info:
+        TargetAccessionCreate(accession="NM_001637.3", assembly=None, gene=None)
+
+    assert "either a `gene` or `assembly` is required" in str(exc_info.value)